@@ -4,9 +4,20 @@
 import os
 import sys
 import re
-from pathlib import Path
+import json
+import time
+import functools
+import hashlib
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, Optional, Iterator, Set, Tuple
+
+try:
+    import hyperscan  # type: ignore[import-not-found]  # optional: DFA/SIMD-Matcher für sehr große Bäume
+except ImportError:
+    hyperscan = None
 
 # Konfiguration - Diese Variablen können angepasst werden
 LICENSE_HEADER = """# -*- coding: utf-8 -*-
@@ -19,156 +30,428 @@ LICENSE_HEADER = """# -*- coding: utf-8 -*-
 AUTHOR = "j.s.drees@az-zwick.com"
 CURRENT_YEAR = datetime.now().year
 
+# Platzhalter für das Erstellungsdatum in den vorberechneten Header-Vorlagen
+_DATE_PLACEHOLDER = "\x00DATE\x00"
+
+# Kommentar-Rahmen (Anfang, Ende) für den Header je Dateierweiterung
+_WRAPPERS = {
+    '.xml': ('<?xml version="1.0" encoding="utf-8"?>\n<!--\n', '\n-->\n'),
+    '.js': ('/*\n', '\n*/\n'),
+    '.scss': ('/*\n', '\n*/\n'),
+    '.css': ('/*\n', '\n*/\n'),
+}
+_DEFAULT_WRAPPER = ('', '\n')  # Python: Header besteht bereits aus #-Kommentaren
+
 # Dateierweiterungen die einen Header bekommen sollen
-HEADER_EXTENSIONS = {'.py', '.xml', '.js', '.scss', '.css'}
+HEADER_EXTENSIONS = frozenset({'.py', '.xml', '.js', '.scss', '.css'})
 
 # Ordner die ignoriert werden sollen
-IGNORE_FOLDERS = {'static', 'wizard', '__pycache__', '.git', '.vscode', 'migrations'}
+IGNORE_FOLDERS = frozenset({'static', 'wizard', '__pycache__', '.git', '.vscode', 'migrations'})
+
+# Spezielle Dateien die nicht umbenannt werden
+_SPECIAL_FILES = frozenset({'__init__', '__manifest__', 'res_partner', 'res_config_settings'})
+
+# Indikatoren für einen vorhandenen Lizenz-Header (einmal kompiliert, auf Bytes)
+_HDR_RE = re.compile(rb'License AGPL-3\.0|Copyright|Created:')
+_PY_CODING_LINE = b'# -*- coding: utf-8 -*-'
+
+
+def _compile_hyperscan_db():
+    """Kompiliert die Header-Indikatoren für Hyperscan (None wenn nicht verfügbar)"""
+    if hyperscan is None:
+        return None
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[rb'License AGPL-3\.0', rb'Copyright', rb'Created:'],
+            ids=[0, 1, 2],
+            elements=3,
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH] * 3,
+        )
+        return db
+    except Exception:
+        return None
+
+
+_HS_DB = _compile_hyperscan_db()
+
+def _day_iso(tm: time.struct_time) -> str:
+    """Formatiert den Kalendertag eines struct_time als YYYY-MM-DD"""
+    return f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _local_day_of_hour(hour: int) -> Optional[str]:
+    """
+    Lokaler Kalendertag für alle Zeitpunkte einer UTC-Stunde (pro Stunde gecacht)
+
+    None, wenn in der Stunde die lokale Mitternacht (z.B. bei UTC+5:30)
+    oder eine Zeitumstellung liegt - dann muss je Zeitstempel gerechnet werden.
+    """
+    start = time.localtime(hour * 3600)
+    end = time.localtime(hour * 3600 + 3599)
+    if start[:3] != end[:3] or start.tm_gmtoff != end.tm_gmtoff:
+        return None
+    return _day_iso(start)
+
+
+# Hyperscan-Scratch ist nicht thread-safe - eine Instanz pro Worker-Thread
+_hs_local = threading.local()
+
+
+def _hs_has_indicator(prefix: bytes) -> bool:
+    """Sucht die Header-Indikatoren per Hyperscan im Dateianfang"""
+    scratch = getattr(_hs_local, 'scratch', None)
+    if scratch is None:
+        scratch = _hs_local.scratch = hyperscan.Scratch(_HS_DB)
+    found = []
+
+    def on_match(match_id, start, end, flags, context):
+        found.append(match_id)
+
+    _HS_DB.scan(prefix, match_event_handler=on_match, scratch=scratch)
+    return bool(found)
+
+# Anzahl Bytes, die für die Header-Erkennung gelesen werden
+HEADER_PREFIX_SIZE = 1024
+
+# Endung der temporären Datei beim atomaren Umschreiben
+TMP_SUFFIX = '.odoo_checker.tmp'
+
+# Worker-Threads für die (I/O-lastige) Dateiprüfung
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Cache für Header-Entscheidungen (relativer Pfad -> [Größe, mtime_ns]); liegt im
+# Benutzer-Cache statt im Modul, damit er weder versioniert noch ausgeliefert wird
+CACHE_DIR_NAME = 'odoo_checker'
+
+
+def _header_cache_path(base_path: str) -> str:
+    """Cache-Datei eines Moduls unter $XDG_CACHE_HOME (bzw. ~/.cache), je Modulpfad"""
+    cache_root = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    digest = hashlib.sha1(base_path.encode('utf-8')).hexdigest()
+    return os.path.join(cache_root, CACHE_DIR_NAME, f'{digest}.json')
 
 # Odoo Core Module (diese werden nicht umbenannt)
-ODOO_CORE_MODULES = {
+ODOO_CORE_MODULES = frozenset({
     'base', 'web', 'mail', 'account', 'sale', 'purchase', 'stock', 
     'hr', 'project', 'website', 'portal', 'payment', 'delivery'
-}
+})
+
+# Alles was die Prüfung über eine Datei wissen muss - einmal beim scandir ermittelt.
+# stat ist nur für Dateien mit Header-Endung gesetzt (sonst None).
+FileTask = namedtuple('FileTask', 'path name stem ext stat module_relevant')
+
 
 class OdooModuleChecker:
-    def __init__(self, base_path: str = "."):
-        self.base_path = Path(base_path).resolve()
-        self.errors = []
-        self.warnings = []
-        self.changes_made = []
-        self.module_name = None
+    def __init__(self, base_path: str = ".", sort_inode: bool = False, verbose: bool = False,
+                 dry_run: bool = False):
+        # Reine Strings statt pathlib - keine PurePath-Objekte im Traversal
+        self.base_path = os.path.realpath(base_path)
+        self.base_name = os.path.basename(self.base_path)
+        # Dateien pro Ordner in Inode-Reihenfolge lesen (HDD/Netzlaufwerke)
+        self.sort_inode = sort_inode
+        # Nur melden, welche Header fehlen - keine Dateien (und keinen Cache) schreiben
+        self.dry_run = dry_run
+        # Meldungen werden live ausgegeben; nur mit verbose zusätzlich in
+        # errors/warnings/changes_made gesammelt. Die Anzahl liefern immer
+        # error_count/warning_count/change_count.
+        self.verbose = verbose
+        self._counts = {'change': 0, 'warning': 0, 'error': 0}
+        self.errors: List[str] = []
+        self.warnings: List[str] = []
+        self.changes_made: List[str] = []
+        self.module_name: Optional[str] = None
+        self._lock = threading.Lock()
+        self._build_header_templates()
+        self.cache_file = _header_cache_path(self.base_path)
+        self._hdr_cache: Dict[str, List[int]] = {}
+        self._hdr_cache_dirty = False
+        # Bereits umgeschriebene Dateien (aufgelöste Pfade), siehe add_header_to_file
+        self._written_targets: Set[str] = set()
+
+    @property
+    def error_count(self) -> int:
+        """Anzahl gemeldeter Fehler (unabhängig von verbose)"""
+        return self._counts['error']
+
+    @property
+    def warning_count(self) -> int:
+        """Anzahl gemeldeter Warnungen (unabhängig von verbose)"""
+        return self._counts['warning']
+
+    @property
+    def change_count(self) -> int:
+        """Anzahl vorgenommener (bzw. im Dry-Run gemeldeter) Änderungen"""
+        return self._counts['change']
         
-    def log_error(self, message: str):
+    def log_error(self, message: str) -> None:
         """Fehlertolerant: Sammelt Fehler statt zu crashen"""
-        self.errors.append(f"FEHLER: {message}")
-        print(f"❌ {message}")
+        with self._lock:
+            self._counts['error'] += 1
+            if self.verbose:
+                self.errors.append(f"FEHLER: {message}")
+        # Eine einzige write()-Operation, damit sich Thread-Ausgaben nicht vermischen
+        print(f"❌ {message}\n", end='')
     
-    def log_warning(self, message: str):
+    def log_warning(self, message: str) -> None:
         """Warnung ausgeben"""
-        self.warnings.append(f"WARNUNG: {message}")
-        print(f"⚠️  {message}")
+        with self._lock:
+            self._counts['warning'] += 1
+            if self.verbose:
+                self.warnings.append(f"WARNUNG: {message}")
+        print(f"⚠️  {message}\n", end='')
     
-    def log_change(self, message: str):
+    def log_change(self, message: str) -> None:
         """Änderung protokollieren"""
-        self.changes_made.append(message)
-        print(f"✅ {message}")
+        with self._lock:
+            self._counts['change'] += 1
+            if self.verbose:
+                self.changes_made.append(message)
+        print(f"✅ {message}\n", end='')
+
+    def _load_header_cache(self) -> Dict[str, List[int]]:
+        """Lädt den Header-Cache vom letzten Lauf (fehlertolerant)"""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            return cache if isinstance(cache, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _header_cache_key(self, task: FileTask, stat: os.stat_result) -> Tuple[str, List[int]]:
+        """Cache-Schlüssel (relativer Pfad) und Signatur (Größe, mtime_ns) einer Datei"""
+        key = os.path.relpath(task.path, self.base_path)
+        return key, [stat.st_size, stat.st_mtime_ns]
+
+    def is_header_cached(self, task: FileTask) -> bool:
+        """Prüft ob die Datei seit dem letzten Lauf unverändert einen Header hat"""
+        key, sig = self._header_cache_key(task, task.stat)
+        return self._hdr_cache.get(key) == sig
+
+    def remember_header(self, task: FileTask, stat: os.stat_result) -> None:
+        """Merkt sich, dass die Datei (mit diesem stat) einen Header hat"""
+        key, sig = self._header_cache_key(task, stat)
+        if self._hdr_cache.get(key) != sig:
+            self._hdr_cache[key] = sig
+            self._hdr_cache_dirty = True
+
+    def save_header_cache(self):
+        """Schreibt den Header-Cache (Fehler sind nicht fatal, im Dry-Run nie)"""
+        if self.dry_run or not self._hdr_cache_dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(self._hdr_cache, f)
+            self._hdr_cache_dirty = False
+        except Exception as e:
+            self.log_warning(f"Konnte Cache {self.cache_file} nicht schreiben: {e}")
 
     def is_custom_module_directory(self) -> bool:
         """Prüft ob der aktuelle Arbeitsordner ein eigenes Modul ist (zw_ Präfix)"""
-        folder_name = self.base_path.name
+        folder_name = self.base_name
         return folder_name.startswith('zw_') and folder_name not in ODOO_CORE_MODULES
 
     def get_module_name(self) -> Optional[str]:
         """Extrahiert den Modulnamen aus dem aktuellen Arbeitsordner"""
         if self.is_custom_module_directory():
-            return self.base_path.name[3:]  # Entfernt "zw_" Präfix
+            return self.base_name[3:]  # Entfernt "zw_" Präfix
         return None
 
     def should_ignore_folder(self, folder_name: str) -> bool:
         """Prüft ob ein Ordner ignoriert werden soll"""
-        return folder_name in IGNORE_FOLDERS or folder_name.startswith('.')
+        return folder_name in IGNORE_FOLDERS or folder_name[:1] == '.'
 
-    def get_file_creation_date(self, file_path: Path) -> str:
+    def get_file_creation_date_from_stat(self, stat: os.stat_result) -> str:
+        """Ermittelt das Erstellungsdatum aus einem bereits vorliegenden stat-Ergebnis"""
+        # Auf Windows: st_ctime ist Erstellungszeit
+        # Auf Unix/Linux: st_ctime ist letzte Metadaten-Änderung
+        # Als Fallback verwenden wir das ältere von beiden Daten
+        creation_time = min(stat.st_ctime, stat.st_mtime)
+        
+        # In lesbares Datum umwandeln: lokaler Kalendertag (berücksichtigt
+        # Sommer-/Winterzeit). Dateien derselben Stunde teilen sich ein
+        # localtime(); nur Stunden mit Tageswechsel werden einzeln gerechnet.
+        day = _local_day_of_hour(int(creation_time // 3600))
+        if day is None:
+            day = _day_iso(time.localtime(creation_time))
+        return day
+
+    def get_file_creation_date(self, task: FileTask) -> str:
         """Ermittelt das Erstellungsdatum einer Datei (fehlertolerant)"""
         try:
-            # Versuche Erstellungsdatum zu ermitteln
-            stat = file_path.stat()
-            
-            # Auf Windows: st_ctime ist Erstellungszeit
-            # Auf Unix/Linux: st_ctime ist letzte Metadaten-Änderung
-            # Als Fallback verwenden wir das ältere von beiden Daten
-            creation_time = min(stat.st_ctime, stat.st_mtime)
-            
-            # In lesbares Datum umwandeln
-            creation_date = datetime.fromtimestamp(creation_time)
-            return creation_date.strftime("%Y-%m-%d")
+            # stat wurde bereits beim scandir ermittelt - kein zusätzlicher Syscall
+            return self.get_file_creation_date_from_stat(task.stat)
             
         except Exception as e:
-            self.log_warning(f"Konnte Erstellungsdatum für {file_path} nicht ermitteln: {e}")
+            self.log_warning(f"Konnte Erstellungsdatum für {task.path} nicht ermitteln: {e}")
             # Fallback: aktuelles Datum
             return datetime.now().strftime("%Y-%m-%d")
 
-    def generate_header(self, file_path: Path) -> str:
-        """Generiert den passenden Header basierend auf Dateierweiterung und Erstellungsdatum"""
-        file_extension = file_path.suffix.lower()
-        creation_date = self.get_file_creation_date(file_path)
-        
+    def _build_header_templates(self):
+        """Baut die Header-Vorlagen einmalig vor - pro Datei wird nur das Datum eingesetzt"""
         header = LICENSE_HEADER.format(
             year=CURRENT_YEAR, 
             author=AUTHOR,
-            creation_date=creation_date
+            creation_date=_DATE_PLACEHOLDER
         )
         
-        if file_extension == '.xml':
-            return f'<?xml version="1.0" encoding="utf-8"?>\n<!--\n{header}\n-->\n'
-        elif file_extension in {'.js', '.scss', '.css'}:
-            return f'/*\n{header}\n*/\n'
-        else:  # Python und andere
-            return f'{header}\n'
-
-    def has_license_header(self, content: str, file_extension: str) -> bool:
-        """Prüft idempotent ob bereits ein Lizenz-Header vorhanden ist"""
-        header_indicators = ['License AGPL-3.0', 'Copyright', 'Created:']
-        
-        if file_extension == '.xml':
-            return any(indicator in content[:500] for indicator in header_indicators)
-        elif file_extension in {'.js', '.scss', '.css'}:
-            return any(indicator in content[:500] for indicator in header_indicators)
-        else:  # Python
-            return (any(indicator in content[:500] for indicator in header_indicators) or
-                   '# -*- coding: utf-8 -*-' in content[:100])
-
-    def check_file_naming(self, file_path: Path, module_name: str) -> bool:
-        """Prüft ob Dateiname dem Modul entspricht (nur für relevante Dateien)"""
-        file_name = file_path.stem
-        
-        # Spezielle Dateien die nicht umbenannt werden
-        special_files = {
-            '__init__', '__manifest__', 'res_partner', 'res_config_settings'
+        pre, post = _DEFAULT_WRAPPER  # Python und andere
+        self._tmpl_default = f'{pre}{header}{post}'
+        self._tmpl_map = {
+            ext: f'{pre}{header}{post}' for ext, (pre, post) in _WRAPPERS.items()
         }
-        
-        if file_name in special_files:
+
+    def generate_header(self, file_extension: str, creation_date: str) -> str:
+        """Generiert den passenden Header basierend auf Dateierweiterung und Erstellungsdatum"""
+        template = self._tmpl_map.get(file_extension, self._tmpl_default)
+        return template.replace(_DATE_PLACEHOLDER, creation_date)
+
+    def has_license_header(self, content: bytes, file_extension: str) -> bool:
+        """Prüft idempotent ob bereits ein Lizenz-Header vorhanden ist (Bytes, ohne Dekodierung)"""
+        # Python: coding-Zeile am Dateianfang gilt ebenfalls als Header - in Odoo-Modulen
+        # der Normalfall, daher vor dem Indikator-Scan und ohne Slice-Kopie prüfen
+        if file_extension not in _WRAPPERS and content.find(_PY_CODING_LINE, 0, 100) != -1:
             return True
-        
-        # Dateien in static/ und wizard/ Ordnern überspringen
-        relative_path = file_path.relative_to(self.base_path)
-        if any(part in {'static', 'wizard'} for part in relative_path.parts):
+        if _HS_DB is not None:
+            return _hs_has_indicator(content[:500])
+        return _HDR_RE.search(content, 0, 500) is not None
+
+    def check_file_naming(self, task: FileTask, module_name: str) -> bool:
+        """Prüft ob Dateiname dem Modul entspricht (nur für relevante Dateien)"""
+        # Spezielle Dateien (__init__, __manifest__, ...) werden nicht umbenannt
+        if not task.module_relevant:
             return True
-            
+        
+        ext = task.ext
         # Security CSV-Dateien haben eigene Namenskonvention
-        if file_path.parent.name == 'security' and file_path.suffix == '.csv':
+        if ext == '.csv' and os.path.basename(os.path.dirname(task.path)) == 'security':
             return True
             
         # Prüfe ob Modulname im Dateinamen enthalten ist (nur für Python/XML Dateien)
-        if file_path.suffix.lower() in {'.py', '.xml'} and module_name not in file_name:
-            self.log_warning(f"Datei '{file_path}' sollte den Modulnamen '{module_name}' enthalten")
+        if ext in {'.py', '.xml'} and module_name not in task.stem:
+            self.log_warning(f"Datei '{task.path}' sollte den Modulnamen '{module_name}' enthalten")
             return False
             
         return True
 
-    def add_header_to_file(self, file_path: Path) -> bool:
+    def _needs_header(self, task: FileTask) -> Tuple[bool, str]:
+        """
+        Gemeinsame Header-Prüfung für echten Lauf und Dry-Run
+
+        Nutzt den Cache, liest höchstens den Dateianfang und das gecachte stat.
+        Liefert (Header fehlt, Erstellungsdatum) - das Datum nur wenn nötig, sonst ''.
+        """
+        # Unveränderte Dateien mit Header aus dem letzten Lauf nicht erneut lesen
+        if self.is_header_cached(task):
+            return False, ''
+
+        # Nur den Dateianfang binär lesen - reicht für die Header-Erkennung
+        with open(task.path, 'rb') as f:
+            prefix = f.read(HEADER_PREFIX_SIZE)
+
+        # Prüfen ob Header bereits vorhanden (idempotent)
+        if self.has_license_header(prefix, task.ext):
+            return False, ''
+
+        return True, self.get_file_creation_date(task)
+
+    def _write_with_header(self, file_path: str, header: bytes, content: bytes,
+                           stat: os.stat_result):
+        """
+        Schreibt Header + Inhalt atomar: temporäre Datei, dann os.replace
+
+        Header und Inhalt werden per os.writev ohne Zusammenkopieren geschrieben;
+        eine abgebrochene Schreiboperation hinterlässt nie eine halbe Datei.
+        Symlinks werden aufgelöst (ersetzt wird das Ziel, nicht der Link);
+        Dateien mit mehreren Hardlinks werden direkt überschrieben, damit alle
+        Links den neuen Inhalt sehen.
+        """
+        target = os.path.realpath(file_path)
+        if stat.st_nlink > 1:
+            with open(target, 'r+b') as f:
+                f.write(header)
+                f.write(content)
+                f.truncate()
+            return
+
+        tmp_path = target + TMP_SUFFIX
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+        fd = os.open(tmp_path, flags, stat.st_mode & 0o7777)
+        try:
+            try:
+                self._copy_metadata(target, fd, stat)
+                total = len(header) + len(content)
+                if hasattr(os, 'writev'):
+                    written = os.writev(fd, [header, content])
+                    remaining = (header + content)[written:] if written < total else b''
+                else:  # Windows
+                    remaining = header + content
+                while remaining:
+                    written = os.write(fd, remaining)
+                    remaining = remaining[written:]
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, target)
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _copy_metadata(self, source: str, fd: int, stat: os.stat_result):
+        """
+        Überträgt Eigentümer/Gruppe, Rechte und xattrs auf die temporäre Datei
+
+        Die Rechte werden per fchmod gesetzt, da der Modus von os.open
+        durch die umask gefiltert wird (0664 würde sonst zu 0644).
+        """
+        if hasattr(os, 'fchown'):
+            try:
+                os.fchown(fd, stat.st_uid, stat.st_gid)
+            except OSError:
+                pass  # fremde Datei ohne Rechte: Eigentümer bleibt der aufrufende Benutzer
+        if hasattr(os, 'fchmod'):
+            os.fchmod(fd, stat.st_mode & 0o7777)
+        if hasattr(os, 'listxattr'):
+            try:
+                for name in os.listxattr(source):
+                    os.setxattr(fd, name, os.getxattr(source, name))
+            except OSError:
+                pass
+
+    def add_header_to_file(self, task: FileTask) -> bool:
         """Fügt Header zu Datei hinzu (idempotent)"""
+        file_path = task.path
         try:
-            # Datei lesen
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            file_extension = file_path.suffix.lower()
-            
-            # Prüfen ob Header bereits vorhanden (idempotent)
-            if self.has_license_header(content, file_extension):
+            needs_header, creation_date = self._needs_header(task)
+            if self.dry_run:
+                if needs_header:
+                    self.log_change(f"WÜRDE Header hinzufügen zu: {file_path} (Erstellt: {creation_date})")
+                return True
+            if not needs_header:
+                self.remember_header(task, task.stat)
                 return True  # Keine Änderung nötig
+
+            # Symlink und Ziel können beide im Modul liegen - nur einmal schreiben
+            target = os.path.realpath(file_path)
+            with self._lock:
+                if target in self._written_targets:
+                    return True
+                self._written_targets.add(target)
+
+            # Header fehlt (selten): komplette Datei laden
+            with open(file_path, 'rb') as f:
+                content = f.read()
             
-            # Header generieren und hinzufügen
-            header = self.generate_header(file_path)
-            new_content = header + content
+            header = self.generate_header(task.ext, creation_date)
             
-            # Datei schreiben (fehlertolerant)
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            # Datei atomar binär schreiben (kein Dekodieren/Enkodieren des Inhalts)
+            self._write_with_header(file_path, header.encode('utf-8'), content, task.stat)
+            self.remember_header(task, os.stat(file_path))
             
-            creation_date = self.get_file_creation_date(file_path)
             self.log_change(f"Header hinzugefügt zu: {file_path} (Erstellt: {creation_date})")
             return True
             
@@ -176,28 +459,68 @@ class OdooModuleChecker:
             self.log_error(f"Konnte Header nicht zu {file_path} hinzufügen: {e}")
             return False
 
-    def check_file(self, file_path: Path, module_name: str):
+    def check_file(self, task: FileTask, module_name: str) -> None:
         """Prüft eine einzelne Datei"""
         # Dateinamen prüfen
-        self.check_file_naming(file_path, module_name)
+        self.check_file_naming(task, module_name)
         
         # Header prüfen/hinzufügen
-        if file_path.suffix.lower() in HEADER_EXTENSIONS:
-            self.add_header_to_file(file_path)
+        if task.ext in HEADER_EXTENSIONS:
+            self.add_header_to_file(task)
+
+    def _check_one(self, task: FileTask) -> None:
+        """Prüft eine Datei im Worker-Thread (Fehler werden gesammelt)"""
+        try:
+            self.check_file(task, self.module_name or '')
+        except Exception as e:
+            self.log_error(f"Fehler beim Prüfen von {task.path}: {e}")
+
+    def _make_task(self, entry: os.DirEntry) -> FileTask:
+        """Ermittelt einmalig Name, Endung und (falls nötig) stat einer Datei"""
+        name = entry.name
+        stem, ext = os.path.splitext(name)
+        ext = ext.lower()
+        stat = entry.stat() if ext in HEADER_EXTENSIONS else None
+        return FileTask(entry.path, name, stem, ext, stat, stem not in _SPECIAL_FILES)
+
+    def _iter_files(self) -> Iterator[FileTask]:
+        """Iteriert per os.scandir über alle Dateien (ignorierte Ordner werden beim Abstieg übersprungen)"""
+        stack = [self.base_path]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    entries = sorted(it, key=lambda e: e.inode()) if self.sort_inode else it
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            # static/, wizard/ & Co. werden nie betreten
+                            if not self.should_ignore_folder(entry.name):
+                                stack.append(entry.path)
+                        elif entry.is_file():
+                            try:
+                                yield self._make_task(entry)
+                            except OSError as e:
+                                self.log_error(f"Datei kann nicht gelesen werden {entry.path}: {e}")
+            except OSError as e:
+                self.log_error(f"Ordner kann nicht gelesen werden {current}: {e}")
 
     def check_current_module(self):
         """Prüft das aktuelle Verzeichnis als Odoo-Modul"""
         self.module_name = self.get_module_name()
         if not self.module_name:
-            self.log_error(f"Das aktuelle Verzeichnis '{self.base_path.name}' ist kein zw_ Modul")
+            self.log_error(f"Das aktuelle Verzeichnis '{self.base_name}' ist kein zw_ Modul")
             return False
             
-        print(f"\n🔍 Prüfe aktuelles Modul: {self.base_path.name} (Modulname: {self.module_name})")
+        print(f"\n🔍 Prüfe aktuelles Modul: {self.base_name} (Modulname: {self.module_name})")
         
-        # Manifest-Datei prüfen
-        manifest_file = self.base_path / '__manifest__.py'
-        if not manifest_file.exists():
+        # Manifest-Datei prüfen - ohne Manifest kein Modul, also nicht traversieren
+        manifest_file = os.path.join(self.base_path, '__manifest__.py')
+        if not os.path.isfile(manifest_file):
             self.log_error(f"Keine __manifest__.py im aktuellen Modul-Verzeichnis")
+            return False
+        
+        # Header-Cache erst laden, wenn das Verzeichnis wirklich geprüft wird
+        self._hdr_cache = self._load_header_cache()
         
         # Standard Odoo-Ordnerstruktur definieren
         standard_folders = {
@@ -205,25 +528,20 @@ class OdooModuleChecker:
             'report', 'static', 'wizard', 'tests'
         }
         
-        # Durch alle Dateien und Unterordner iterieren
-        for root, dirs, files in os.walk(self.base_path):
-            root_path = Path(root)
-            
-            # Ordner filtern (fehlertolerant) - static und wizard ignorieren
-            dirs[:] = [d for d in dirs if not self.should_ignore_folder(d)]
-            
-            # Dateien prüfen
-            for file_name in files:
-                file_path = root_path / file_name
-                try:
-                    self.check_file(file_path, self.module_name)
-                except Exception as e:
-                    self.log_error(f"Fehler beim Prüfen von {file_path}: {e}")
+        # Durch alle Dateien und Unterordner iterieren (static und wizard ignorieren)
+        # Die Prüfung ist I/O-lastig und läuft daher parallel in Threads
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            list(executor.map(self._check_one, self._iter_files()))
         
         return True
 
     def run_check(self):
         """Hauptfunktion - startet die Überprüfung des aktuellen Moduls"""
+        # Kein zw_ Modul: sofort abbrechen, ohne I/O und ohne Ausgabe-Kopf/Zusammenfassung
+        if not self.is_custom_module_directory():
+            self.log_error(f"Das aktuelle Verzeichnis '{self.base_name}' ist kein zw_ Modul")
+            return
+        
         print(f"🚀 Starte Odoo-Modul-Überprüfung in: {self.base_path}")
         print(f"📅 Aktuelles Jahr: {CURRENT_YEAR}")
         print(f"👤 Author: {AUTHOR}")
@@ -238,6 +556,9 @@ class OdooModuleChecker:
         except Exception as e:
             self.log_error(f"Unerwarteter Fehler: {e}")
         
+        # Header-Cache für den nächsten Lauf sichern
+        self.save_header_cache()
+
         # Zusammenfassung ausgeben
         self.print_summary()
 
@@ -247,25 +568,48 @@ class OdooModuleChecker:
         print("📊 ZUSAMMENFASSUNG")
         print("=" * 60)
         
-        print(f"✅ Änderungen vorgenommen: {len(self.changes_made)}")
+        counts = self._counts
+        print(f"✅ Änderungen vorgenommen: {counts['change']}")
         for change in self.changes_made:
             print(f"   • {change}")
         
-        print(f"\n⚠️  Warnungen: {len(self.warnings)}")
+        print(f"\n⚠️  Warnungen: {counts['warning']}")
         for warning in self.warnings:
             print(f"   • {warning}")
         
-        print(f"\n❌ Fehler: {len(self.errors)}")
+        print(f"\n❌ Fehler: {counts['error']}")
         for error in self.errors:
             print(f"   • {error}")
         
-        if not self.errors and not self.warnings:
+        if not counts['error'] and not counts['warning']:
             print("\n🎉 Alle Module sind korrekt strukturiert!")
-        elif not self.errors:
+        elif not counts['error']:
             print("\n✅ Überprüfung abgeschlossen (nur Warnungen)")
         else:
             print("\n❌ Überprüfung abgeschlossen mit Fehlern")
 
+def _load_checker_class():
+    """
+    Bevorzugt eine mit mypyc kompilierte Variante dieses Skripts
+
+    `mypyc odoo_checker.py` erzeugt odoo_checker.*.so neben dem Skript; ist diese
+    vorhanden, wird deren OdooModuleChecker genutzt, sonst die reine Python-Klasse.
+    """
+    import importlib.machinery
+    import importlib.util
+
+    if __name__ != "__main__":
+        return OdooModuleChecker
+    try:
+        spec = importlib.util.find_spec('odoo_checker')
+        if spec is None or not (spec.origin or '').endswith(tuple(importlib.machinery.EXTENSION_SUFFIXES)):
+            return OdooModuleChecker
+        import odoo_checker as compiled
+        return compiled.OdooModuleChecker
+    except Exception:
+        return OdooModuleChecker
+
+
 def main():
     """Hauptfunktion des Skripts"""
     import argparse
@@ -278,6 +622,7 @@ Beispiele:
   cd zw_inventory_management && python odoo_checker.py    # Im Modul-Ordner ausführen
   python odoo_checker.py /pfad/zu/zw_mein_modul          # Spezifisches zw_ Modul
   python odoo_checker.py --dry-run                       # Nur Überprüfung, keine Änderungen
+  mypyc odoo_checker.py                                  # Optional: kompilierte, schnellere Variante bauen
 
 Wichtig: Das Skript muss in einem Ordner ausgeführt werden, der mit 'zw_' anfängt.
 Alle Unterordner folgen dem Standard Odoo-Naming (models/, views/, controllers/, etc.)
@@ -297,33 +642,34 @@ Alle Unterordner folgen dem Standard Odoo-Naming (models/, views/, controllers/,
         help='Nur überprüfen, keine Änderungen vornehmen'
     )
     
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='Alle Meldungen in der Zusammenfassung erneut auflisten'
+    )
+    
+    parser.add_argument(
+        '--sort-inode',
+        action='store_true',
+        help='Dateien in Inode-Reihenfolge lesen (schneller auf HDDs/Netzlaufwerken)'
+    )
+    
     args = parser.parse_args()
     
     if args.dry_run:
         print("🔍 DRY-RUN Modus: Keine Änderungen werden vorgenommen")
     
-    checker = OdooModuleChecker(args.path)
-    
-    # Bei dry-run die add_header_to_file Methode überschreiben
-    if args.dry_run:
-        def dry_run_add_header(file_path):
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                if not checker.has_license_header(content, file_path.suffix.lower()):
-                    creation_date = checker.get_file_creation_date(file_path)
-                    checker.log_change(f"WÜRDE Header hinzufügen zu: {file_path} (Erstellt: {creation_date})")
-            except Exception as e:
-                checker.log_error(f"Fehler beim Dry-Run für {file_path}: {e}")
-            return True
-        checker.add_header_to_file = dry_run_add_header
+    checker_class = _load_checker_class()
+    checker = checker_class(
+        args.path, sort_inode=args.sort_inode, verbose=args.verbose, dry_run=args.dry_run
+    )
     
     checker.run_check()
     
     # Exit-Code basierend auf Ergebnissen
-    if checker.errors:
+    if checker.error_count:
         sys.exit(1)
-    elif checker.warnings:
+    elif checker.warning_count:
         sys.exit(2)
     else:
         sys.exit(0)
@@ -0,0 +1,186 @@
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+"""
+Eigenständige Tests für odoo_checker.py (ohne Odoo-Server)
+
+Nicht in tests/__init__.py eingebunden; Ausführung z.B. mit
+python tests/test_odoo_checker.py
+"""
+import calendar
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import odoo_checker  # noqa: E402
+
+
+def _fake_stat(timestamp):
+    """stat-Ergebnis mit gleicher ctime/mtime"""
+    return os.stat_result((0o100644, 0, 0, 1, 0, 0, 0, timestamp, timestamp, timestamp))
+
+
+@unittest.skipUnless(hasattr(time, "tzset"), "time.tzset nicht verfügbar")
+class TestCreationDate(unittest.TestCase):
+    def setUp(self):
+        self._old_tz = os.environ.get("TZ")
+        os.environ["TZ"] = "Europe/Berlin"
+        time.tzset()
+        # Stunden-Cache gilt nur für eine Zeitzone
+        odoo_checker._local_day_of_hour.cache_clear()
+        self.addCleanup(odoo_checker._local_day_of_hour.cache_clear)
+        self.checker = odoo_checker.OdooModuleChecker(dry_run=True)
+
+    def tearDown(self):
+        if self._old_tz is None:
+            os.environ.pop("TZ", None)
+        else:
+            os.environ["TZ"] = self._old_tz
+        time.tzset()
+
+    def test_local_day_across_dst(self):
+        # Kurz nach und kurz vor Mitternacht Ortszeit, jeweils in Winter- (UTC+1)
+        # und Sommerzeit (UTC+2); ein fester Offset verschiebt einen der Tage
+        cases = {
+            (2026, 1, 14, 23, 30, 0): "2026-01-15",  # 00:30 MEZ
+            (2026, 1, 15, 22, 30, 0): "2026-01-15",  # 23:30 MEZ
+            (2026, 7, 14, 22, 30, 0): "2026-07-15",  # 00:30 MESZ
+            (2026, 7, 15, 21, 30, 0): "2026-07-15",  # 23:30 MESZ
+        }
+        for utc, expected in cases.items():
+            stat = _fake_stat(calendar.timegm(utc))
+            self.assertEqual(self.checker.get_file_creation_date_from_stat(stat), expected)
+
+    def test_hour_cache_matches_localtime(self):
+        # Umstellungstage in Berlin sowie eine Zone mit halbstündigem Offset,
+        # deren Mitternacht mitten in einer UTC-Stunde liegt
+        days = {
+            "Europe/Berlin": [(2026, 3, 28), (2026, 10, 24)],
+            "Asia/Kolkata": [(2026, 5, 1)],
+        }
+        for tz, dates in days.items():
+            os.environ["TZ"] = tz
+            time.tzset()
+            odoo_checker._local_day_of_hour.cache_clear()
+            for date in dates:
+                start = calendar.timegm(date + (0, 0, 0))
+                for ts in range(start, start + 2 * 86400, 600):
+                    expected = time.strftime("%Y-%m-%d", time.localtime(ts))
+                    with self.subTest(tz=tz, ts=ts):
+                        self.assertEqual(
+                            self.checker.get_file_creation_date_from_stat(_fake_stat(ts)), expected
+                        )
+
+
+class _ModuleCase(unittest.TestCase):
+    """Temporäres Demo-Modul, Cache-Verzeichnis auf tmp umgebogen"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self._old_cache_home = os.environ.get("XDG_CACHE_HOME")
+        self.cache_home = os.path.join(self.tmp, "cache")
+        os.environ["XDG_CACHE_HOME"] = self.cache_home
+        self.module = os.path.join(self.tmp, "zw_demo")
+        os.makedirs(os.path.join(self.module, "models"))
+        with open(os.path.join(self.module, "__manifest__.py"), "w") as f:
+            f.write("# -*- coding: utf-8 -*-\n{'name': 'Demo'}\n")
+        self.model_file = os.path.join(self.module, "models", "demo_order.py")
+        with open(self.model_file, "w") as f:
+            f.write("from odoo import models\n")
+
+    def tearDown(self):
+        if self._old_cache_home is None:
+            os.environ.pop("XDG_CACHE_HOME", None)
+        else:
+            os.environ["XDG_CACHE_HOME"] = self._old_cache_home
+
+    def _run(self, **kwargs):
+        checker = odoo_checker.OdooModuleChecker(self.module, **kwargs)
+        with contextlib.redirect_stdout(io.StringIO()):
+            checker.run_check()
+        return checker
+
+
+class TestHeaderCache(_ModuleCase):
+    def test_cache_round_trip_outside_module(self):
+        checker = self._run()
+        self.assertTrue(checker.cache_file.startswith(self.cache_home))
+        self.assertTrue(os.path.isfile(checker.cache_file))
+        # Im Modul selbst entsteht keine Cache-Datei
+        self.assertEqual(sorted(os.listdir(self.module)), ["__manifest__.py", "models"])
+
+        second = odoo_checker.OdooModuleChecker(self.module)
+        second._hdr_cache = second._load_header_cache()
+        with os.scandir(os.path.dirname(self.model_file)) as entries:
+            task = second._make_task(next(e for e in entries if e.name == "demo_order.py"))
+        self.assertTrue(second.is_header_cached(task))
+
+    def test_dry_run_writes_no_cache(self):
+        checker = self._run(dry_run=True)
+        self.assertFalse(os.path.exists(checker.cache_file))
+        with open(self.model_file) as f:
+            self.assertEqual(f.read(), "from odoo import models\n")
+
+
+class TestCounts(_ModuleCase):
+    def test_counts_without_verbose(self):
+        # Dateiname ohne Modul-Präfix erzeugt eine Warnung
+        with open(os.path.join(self.module, "models", "other.py"), "w") as f:
+            f.write("from odoo import models\n")
+        checker = self._run(dry_run=True)
+        self.assertEqual(checker.warnings, [])
+        self.assertGreater(checker.warning_count, 0)
+        self.assertEqual(checker.error_count, 0)
+
+
+class TestWriteWithHeader(_ModuleCase):
+    """Header-Schreiben über Symlinks/Hardlinks, Rechte bleiben erhalten"""
+
+    def _read(self, path):
+        with open(path) as f:
+            return f.read()
+
+    def test_mode_preserved(self):
+        # 0664 wird von der umask 022 gefiltert, os.open allein genügt also nicht
+        old_umask = os.umask(0o022)
+        self.addCleanup(os.umask, old_umask)
+        os.chmod(self.model_file, 0o664)
+        self._run()
+        content = self._read(self.model_file)
+        self.assertTrue(content.startswith("# -*- coding: utf-8 -*-"))
+        self.assertTrue(content.endswith("from odoo import models\n"))
+        self.assertEqual(os.stat(self.model_file).st_mode & 0o7777, 0o664)
+
+    @unittest.skipUnless(hasattr(os, "symlink"), "keine Symlinks")
+    def test_symlink_kept_and_target_written_once(self):
+        link = os.path.join(self.module, "models", "demo_order_link.py")
+        os.symlink("demo_order.py", link)
+        self._run()
+        self.assertTrue(os.path.islink(link))
+        content = self._read(self.model_file)
+        self.assertEqual(content.count("# -*- coding: utf-8 -*-"), 1)
+        self.assertEqual(self._read(link), content)
+        self.assertFalse(any(
+            name.endswith(odoo_checker.TMP_SUFFIX)
+            for name in os.listdir(os.path.join(self.module, "models"))
+        ))
+
+    @unittest.skipUnless(hasattr(os, "link"), "keine Hardlinks")
+    def test_hardlink_shares_new_content(self):
+        outside = os.path.join(self.tmp, "demo_order_copy.py")
+        os.link(self.model_file, outside)
+        inode = os.stat(self.model_file).st_ino
+        self._run()
+        self.assertEqual(os.stat(self.model_file).st_ino, inode)
+        self.assertEqual(self._read(outside), self._read(self.model_file))
+        self.assertTrue(self._read(outside).startswith("# -*- coding: utf-8 -*-"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,192 @@
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+"""
+Eigenständige Tests für xml_debugger.py (ohne Odoo-Server)
+
+Nicht in tests/__init__.py eingebunden; Ausführung z.B. mit
+python tests/test_xml_debugger.py
+"""
+import contextlib
+import io
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import xml_debugger  # noqa: E402
+
+DECL = b'<?xml version="1.0" encoding="utf-8"?>\n'
+
+# Wohlgeformte Dateien, die trotzdem strukturelle Probleme haben
+DATA_OUTSIDE_ODOO = DECL + b'<data>\n<odoo>\n<record id="a" model="x"/>\n</odoo>\n</data>\n'
+OPENERP_COMMENTED_ODOO = DECL + (
+    b'<openerp>\n<!-- <odoo> -->\n<data>\n<record id="a" model="x"/>\n</data>\n</openerp>\n'
+)
+
+SAMPLES = {
+    'ok': DECL + b'<odoo>\n<data>\n<record id="a" model="x"/>\n</data>\n</odoo>\n',
+    'no_data': DECL + b'<odoo>\n<record id="a" model="x"/>\n</odoo>\n',
+    'self_closing': DECL + b'<odoo/>\n',
+    'multi_data': DECL + b'<odoo>\n<data>\n</data>\n<data noupdate="1">\n</data>\n</odoo>\n',
+    'nested_data': DECL + b'<odoo>\n<data>\n<data/>\n</data>\n</odoo>\n',
+    'commented_data': DECL + b'<odoo>\n<!-- <data> -->\n<record id="a" model="x"/>\n</odoo>\n',
+    'commented_close': DECL + b'<odoo>\n<!-- </odoo> -->\n</odoo>\n',
+    'data_outside': DATA_OUTSIDE_ODOO,
+    'openerp': OPENERP_COMMENTED_ODOO,
+    'broken': DECL + b'<odoo>\n<data>\n<record id="a" model="x">\n</data>\n</odoo>\n',
+}
+
+
+class _XMLCase(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+        # Der Debugger legt seine Logdatei im Arbeitsverzeichnis an
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.tmp)
+        self.debugger = xml_debugger.OdooXMLDebugger(auto_fix=False)
+
+    def _write(self, name, content):
+        path = self.tmp / f'{name}.xml'
+        path.write_bytes(content)
+        return path
+
+    def _messages(self, analysis):
+        return [issue.message for issue in analysis['issues']]
+
+
+class TestFastPath(_XMLCase):
+    def test_data_outside_odoo_reported(self):
+        analysis = self.debugger.analyze_xml_structure(self._write('outside', DATA_OUTSIDE_ODOO))
+        self.assertIn('<data> Tag außerhalb von <odoo> auf Zeile 2', self._messages(analysis))
+
+    def test_openerp_root_with_commented_odoo(self):
+        analysis = self.debugger.analyze_xml_structure(self._write('openerp', OPENERP_COMMENTED_ODOO))
+        self.assertIn('Unausgewogene <odoo> Tags: 1 öffnende, 0 schließende', self._messages(analysis))
+        self.assertFalse(analysis['valid'])
+
+    def test_fast_path_matches_full_path(self):
+        for name, content in SAMPLES.items():
+            with self.subTest(name=name):
+                path = self._write(name, content)
+                fast = self.debugger.analyze_xml_structure(path)
+                with mock.patch.object(xml_debugger.OdooXMLDebugger, '_fast_validate',
+                                       return_value=False):
+                    full = self.debugger.analyze_xml_structure(path)
+                self.assertEqual(fast, full)
+
+
+class TestAnalysisCache(_XMLCase):
+    def setUp(self):
+        super().setUp()
+        self._old_cache_home = os.environ.get('XDG_CACHE_HOME')
+        self.cache_home = self.tmp / 'cache'
+        os.environ['XDG_CACHE_HOME'] = str(self.cache_home)
+        self.module = self.tmp / 'zw_demo'
+        (self.module / 'views').mkdir(parents=True)
+        (self.module / 'views' / 'ok.xml').write_bytes(SAMPLES['ok'])
+        (self.module / 'views' / 'multi.xml').write_bytes(SAMPLES['multi_data'])
+
+    def tearDown(self):
+        if self._old_cache_home is None:
+            os.environ.pop('XDG_CACHE_HOME', None)
+        else:
+            os.environ['XDG_CACHE_HOME'] = self._old_cache_home
+
+    def _scan(self, **kwargs):
+        debugger = xml_debugger.OdooXMLDebugger(**kwargs)
+        with contextlib.redirect_stdout(io.StringIO()):
+            return debugger, debugger.scan_module(self.module)
+
+    def _module_files(self):
+        return sorted(str(p.relative_to(self.module)) for p in self.module.rglob('*'))
+
+    def test_cache_round_trip_outside_module(self):
+        files_before = self._module_files()
+        debugger, first = self._scan()
+        cache_file = xml_debugger._cache_path(self.module)
+        self.assertTrue(str(cache_file).startswith(str(self.cache_home)))
+        self.assertTrue(cache_file.is_file())
+        self.assertEqual(self._module_files(), files_before)
+        self.assertEqual(sorted(debugger._load_cache(self.module)),
+                         ['views/multi.xml', 'views/ok.xml'])
+
+        # Zweiter Lauf liefert die gleichen Ergebnisse aus dem Cache
+        with mock.patch.object(xml_debugger.OdooXMLDebugger, '_analyze_files',
+                               return_value=[]) as analyze:
+            _debugger, second = self._scan()
+        analyze.assert_called_once_with([])
+        self.assertEqual(second['files'], first['files'])
+
+    def test_validate_only_writes_no_cache(self):
+        self._scan(save_cache=False)
+        self.assertFalse(xml_debugger._cache_path(self.module).exists())
+
+
+class TestResultShapes(_XMLCase):
+    def test_issue_as_dict_drops_unset_fields(self):
+        issue = xml_debugger.Issue(type='CRITICAL', message='m', line_info=[3])
+        self.assertEqual(issue.as_dict(), {'type': 'CRITICAL', 'message': 'm', 'line_info': [3]})
+
+    def test_analysis_json_round_trip(self):
+        analysis = self.debugger.analyze_xml_structure(self._write('multi', SAMPLES['multi_data']))
+        self.assertTrue(all(isinstance(i, xml_debugger.Issue) for i in analysis['issues']))
+        exported = json.loads(json.dumps(xml_debugger._analysis_as_json(analysis)))
+        self.assertIsInstance(exported['issues'][0], dict)
+        self.assertEqual(xml_debugger._analysis_from_json(exported), analysis)
+
+    def test_auto_fix_returns_new_content(self):
+        debugger = xml_debugger.OdooXMLDebugger(auto_fix=True, create_backup=False)
+        path = self._write('multi', SAMPLES['multi_data'])
+        success, new_content = debugger.auto_fix_xml_file(path, debugger.analyze_xml_structure(path))
+        self.assertTrue(success)
+        self.assertIsInstance(new_content, bytes)
+        self.assertEqual(path.read_bytes(), new_content)
+        reanalysis = debugger.analyze_xml_content(new_content, path)
+        self.assertNotIn('multi_data', [issue.fix_key for issue in reanalysis['issues']])
+
+    def test_auto_fix_without_changes_returns_none(self):
+        debugger = xml_debugger.OdooXMLDebugger(auto_fix=True, create_backup=False)
+        path = self._write('ok', SAMPLES['ok'])
+        result = debugger.auto_fix_xml_file(path, debugger.analyze_xml_structure(path))
+        self.assertEqual(result, (True, None))
+        self.assertEqual(path.read_bytes(), SAMPLES['ok'])
+
+
+class TestChunkedHelpers(unittest.TestCase):
+    def _decode_error(self, content):
+        try:
+            str(content, 'utf-8')
+        except UnicodeDecodeError as e:
+            return str(e)
+        return None
+
+    def test_utf8_error_matches_full_decode(self):
+        size = xml_debugger._CHUNK_SIZE
+        cases = [
+            b'',
+            'ä€😀'.encode('utf-8') * size,
+            b'a' * (size - 1) + 'ä'.encode('utf-8') + b'\xff',  # Zeichen über Blockgrenze
+            b'a' * (size - 2) + b'\xf0\x9f\x98' + b'x',        # abgebrochene Sequenz über Blockgrenze
+            b'a' * size + b'\xc3',                              # unvollständig am Dateiende
+        ]
+        for content in cases:
+            with self.subTest(size=len(content)):
+                self.assertEqual(xml_debugger._utf8_error(content), self._decode_error(content))
+
+    def test_newline_offsets_across_chunks(self):
+        content = b'ab\ncd\n' * xml_debugger._CHUNK_SIZE
+        self.assertEqual(list(xml_debugger._newline_offsets(content)),
+                         xml_debugger._find_all(content, b'\n'))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -19,14 +19,77 @@ Anwendungsbeispiele:
 """
 
 import logging
-from collections import defaultdict
+from collections import Counter
 
 from odoo import _, api, fields, models
 from odoo.exceptions import UserError, ValidationError
 from odoo.tools import float_is_zero, float_compare
 
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # optional: ohne Numba bleibt es bei der reinen Python-Schleife
+    np = None
+    njit = None
+
 _logger = logging.getLogger(__name__)
 
+# Mengen-Genauigkeit für alle Vergleiche im Wizard
+_PRECISION_DIGITS = 3
+_PRECISION_TOL = 10 ** -_PRECISION_DIGITS
+
+# Many2one-Felder, die 1:1 von der Blanket Order in jede Sale Order wandern
+_SO_FIELDS_FROM_BLANKET = (
+    ("user_id", "user_id"),
+    ("pricelist_id", "pricelist_id"),
+    ("payment_term_id", "payment_term_id"),
+    ("team_id", "team_id"),
+    ("company_id", "company_id"),
+)
+
+# Ab dieser Zeilenanzahl lohnt sich die Umwandlung in Arrays für Numba
+_JIT_MIN_LINES = 100
+
+# Obergrenze für Wizard Lines pro Aufruf
+_MAX_WIZARD_LINES = 5000
+
+# Cursor-Cache-Schlüssel: expire_orders() läuft höchstens einmal pro Transaktion
+_EXPIRE_CHECKED_KEY = "sale_blanket_order_expire_checked"
+
+
+def _find_qty_violations_py(qtys, remainings, tol):
+    """Indizes aller Zeilen mit negativer Menge oder Menge > Restmenge + tol"""
+    return [
+        idx for idx, (qty, remaining) in enumerate(zip(qtys, remainings))
+        if qty < 0 or qty - remaining > tol
+    ]
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _find_qty_violations_jit(qtys, remainings, tol):
+        out = np.empty(qtys.shape[0], np.int64)
+        k = 0
+        for i in range(qtys.shape[0]):
+            if qtys[i] < 0 or qtys[i] - remainings[i] > tol:
+                out[k] = i
+                k += 1
+        return out[:k]
+
+    def _find_qty_violations(qtys, remainings, tol):
+        """Wie _find_qty_violations_py, bei vielen Zeilen JIT-kompiliert"""
+        if len(qtys) < _JIT_MIN_LINES:
+            return _find_qty_violations_py(qtys, remainings, tol)
+        return _find_qty_violations_jit(
+            np.asarray(qtys, dtype=np.float64),
+            np.asarray(remainings, dtype=np.float64),
+            tol,
+        ).tolist()
+
+else:
+    _find_qty_violations = _find_qty_violations_py
+
 
 class BlanketOrderWizardLine(models.TransientModel):
     _name = "sale.blanket.order.wizard.line"
@@ -116,12 +179,11 @@ class BlanketOrderWizardLine(models.TransientModel):
     @api.depends('qty', 'price_unit')
     def _compute_price_subtotal(self):
         """Berechne Subtotal für Wizard Line"""
-        for line in self:
-            try:
-                line.price_subtotal = line.qty * line.price_unit
-            except Exception as e:
-                _logger.warning("Fehler bei Subtotal-Berechnung: %s", str(e))
-                line.price_subtotal = 0.0
+        # Eingaben einmal gesammelt lesen; float * float kann nicht fehlschlagen
+        qtys = self.mapped("qty")
+        prices = self.mapped("price_unit")
+        for line, qty, price in zip(self, qtys, prices):
+            line.price_subtotal = qty * price
 
     @api.constrains('qty', 'remaining_uom_qty')
     def _check_qty_limits(self):
@@ -133,36 +195,55 @@ class BlanketOrderWizardLine(models.TransientModel):
         - Benutzerfreundliche Fehlermeldungen
         - Robuste Edge-Case-Behandlung
         """
-        for line in self:
-            try:
-                if line.qty < 0:
-                    raise ValidationError(_("Quantity cannot be negative."))
-
-                precision_digits = 3
-                precision = 10 ** -precision_digits
-
-                if float_is_zero(line.remaining_uom_qty, precision_digits=precision_digits):
-                    if line.qty > precision:
-                        raise ValidationError(
-                            _("No remaining quantity available for product %s")
-                            % (line.product_id.name or 'Unknown')
-                        )
-                    continue
-
-                # Prüfe Überschreitung mit Toleranz
-                if float_compare(line.qty, line.remaining_uom_qty, precision_digits=precision_digits) > 0:
-                    raise ValidationError(
-                        _("Quantity to order (%.3f) cannot exceed remaining quantity (%.3f) for product %s")
-                        % (line.qty, line.remaining_uom_qty, line.product_id.name or 'Unknown')
-                    )
-
-            except ValidationError:
-                raise
-            except Exception as e:
-                _logger.error("Unerwarteter Fehler bei Mengen-Validierung: %s", str(e))
-                raise ValidationError(
-                    _("Error validating quantities: %s") % str(e)
-                )
+        try:
+            # Lokale Bindungen für die Kandidaten-Schleife
+            is_zero = float_is_zero
+            compare = float_compare
+
+            # Mengen einmal für den ganzen Recordset lesen statt pro Zeile über die ORM;
+            # remaining_uom_qty ist related, die Blanket Lines daher vorab in einem SELECT laden
+            self.blanket_line_id.fetch(["remaining_uom_qty"])
+            qtys = self.mapped("qty")
+            remainings = self.mapped("remaining_uom_qty")
+
+            # Grober Vorfilter über alle Zeilen; die exakte Prüfung mit
+            # float_compare läuft nur noch für die gefundenen Kandidaten
+            candidates = _find_qty_violations(qtys, remainings, _PRECISION_TOL / 4)
+            if any(qtys[idx] < 0 for idx in candidates):
+                raise ValidationError(_("Quantity cannot be negative."))
+
+            no_remaining = []
+            exceeding = []
+            for idx in candidates:
+                qty = qtys[idx]
+                remaining = remainings[idx]
+                if is_zero(remaining, precision_digits=_PRECISION_DIGITS):
+                    if qty > _PRECISION_TOL:
+                        no_remaining.append(idx)
+                elif compare(qty, remaining, precision_digits=_PRECISION_DIGITS) > 0:
+                    exceeding.append(idx)
+
+            if no_remaining or exceeding:
+                # Produktnamen nur im Fehlerfall lesen
+                messages = [
+                    _("No remaining quantity available for product %s")
+                    % (self[idx].product_id.name or 'Unknown')
+                    for idx in no_remaining
+                ]
+                messages += [
+                    _("Quantity to order (%.3f) cannot exceed remaining quantity (%.3f) for product %s")
+                    % (qtys[idx], remainings[idx], self[idx].product_id.name or 'Unknown')
+                    for idx in exceeding
+                ]
+                raise ValidationError("\n".join(messages))
+
+        except ValidationError:
+            raise
+        except Exception as e:
+            _logger.error("Unerwarteter Fehler bei Mengen-Validierung: %s", str(e))
+            raise ValidationError(
+                _("Error validating quantities: %s") % str(e)
+            )
 
 
 class BlanketOrderWizard(models.TransientModel):
@@ -180,31 +261,52 @@ class BlanketOrderWizard(models.TransientModel):
         - Robuste Error-Handling
         """
         try:
-            # Auto-Expiration vor Processing
-            self.env["sale.blanket.order"].expire_orders()
-            
             active_id = self.env.context.get("active_id")
             if not active_id:
                 return False
                 
-            blanket_order = self.env["sale.blanket.order"].browse(active_id)
-            if not blanket_order.exists():
+            # Existenz, Status und Gültigkeit in einem SELECT statt
+            # exists() und anschließendem Feld-Read
+            blanket_order_obj = self.env["sale.blanket.order"]
+            blanket_order_obj.flush_model(["state", "name", "validity_date"])
+            self.env.cr.execute(
+                "SELECT state, name, validity_date FROM sale_blanket_order WHERE id = %s",
+                (active_id,),
+            )
+            row = self.env.cr.fetchone()
+            if not row:
                 return False
+            state, name, validity_date = row
+
+            # Auto-Expiration nur, wenn die aktive Order selbst überfällig ist
+            # (sonst erledigt das der Cron), und höchstens einmal pro Transaktion:
+            # blanket_order_id und line_ids rufen beide _default_order auf
+            cr_cache = self.env.cr.cache
+            if (
+                not self.env.context.get("skip_expire")
+                and not cr_cache.get(_EXPIRE_CHECKED_KEY)
+                and state == "open"
+                and validity_date
+                and validity_date < fields.Date.today()
+            ):
+                blanket_order_obj.expire_orders()
+                cr_cache[_EXPIRE_CHECKED_KEY] = True
+                state = blanket_order_obj.browse(active_id).state
 
             # Status-Validierung
-            if blanket_order.state == "expired":
+            if state == "expired":
                 raise UserError(
                     _("Cannot create sale orders from expired blanket order %s!")
-                    % blanket_order.name
+                    % name
                 )
                 
-            if blanket_order.state != "open":
+            if state != "open":
                 raise UserError(
                     _("Blanket order %s must be in 'Open' state to create sale orders (current: %s)")
-                    % (blanket_order.name, blanket_order.state)
+                    % (name, state)
                 )
                 
-            return blanket_order
+            return blanket_order_obj.browse(active_id)
             
         except UserError:
             raise
@@ -227,51 +329,45 @@ class BlanketOrderWizard(models.TransientModel):
         if not bo_lines:
             raise UserError(_("No blanket order lines provided."))
 
-        precision_digits = 3
-        company_id = None
-
-        valid_lines = bo_lines.filtered(
-            lambda line: not float_is_zero(line.remaining_uom_qty, precision_digits=precision_digits)
+        # Existenzprüfung in der Datenbank: eine Zeile mit Restmenge genügt.
+        # remaining_uom_qty ist nicht negativ und gilt ab der halben
+        # Genauigkeitsstufe als nicht null (wie float_is_zero)
+        has_remaining = bo_lines.search_count(
+            [("id", "in", bo_lines.ids), ("remaining_uom_qty", ">=", _PRECISION_TOL / 2)],
+            limit=1,
         )
 
-        if not valid_lines:
+        if not has_remaining:
             raise UserError(
                 _("All selected lines have already been completely ordered. "
                   "No remaining quantities available.")
             )
 
-        # Line-by-Line Validierung
-        for line in bo_lines:
-            try:
-                if not line.order_id:
-                    raise UserError(
-                        _("Line %s has no associated blanket order.") % (line.id)
-                    )
-
-                if line.order_id.state != "open":
-                    raise UserError(
-                        _("Blanket Order %s is not open (current state: %s)")
-                        % (line.order_id.name, line.order_id.state)
-                    )
-
-                line_company_id = line.order_id.company_id.id if line.order_id.company_id else None
-                
-                if company_id is None:
-                    company_id = line_company_id
-                elif company_id != line_company_id:
-                    raise UserError(
-                        _("You have to select lines from the same company. "
-                          "Found companies: %s vs %s") 
-                        % (company_id, line_company_id)
-                    )
-
-            except UserError:
-                raise
-            except Exception as e:
-                _logger.error("Fehler bei Line-Validierung %s: %s", line.id, str(e))
-                raise UserError(
-                    _("Error validating line %s: %s") % (line.id, str(e))
-                )
+        # Mengenbasierte Validierung über die Blanket Orders statt pro Zeile
+        lines_without_order = bo_lines.filtered(lambda line: not line.order_id)
+        if lines_without_order:
+            raise UserError(
+                _("Line %s has no associated blanket order.") % (lines_without_order[0].id)
+            )
+
+        orders = bo_lines.order_id
+        not_open = orders.filtered_domain([("state", "!=", "open")])[:1]
+        if not_open:
+            raise UserError(
+                _("Blanket Order %s is not open (current state: %s)")
+                % (not_open[0].name, not_open[0].state)
+            )
+
+        # Erste abweichende Firma gegenüber der Firma der ersten Zeile melden
+        company_ids = orders.mapped(lambda order: order.company_id.id or None)
+        company_id = company_ids[0] if company_ids else None
+        other_company_id = next((cid for cid in company_ids if cid != company_id), company_id)
+        if other_company_id != company_id:
+            raise UserError(
+                _("You have to select lines from the same company. "
+                  "Found companies: %s vs %s")
+                % (company_id, other_company_id)
+            )
 
     @api.model
     def _default_lines(self):
@@ -303,27 +399,41 @@ class BlanketOrderWizard(models.TransientModel):
             if not bo_lines:
                 return []
 
+            # Der Client muss jede Wizard Line rendern: Auswahl begrenzen
+            if len(bo_lines) > _MAX_WIZARD_LINES:
+                raise UserError(
+                    _("Too many lines selected (%d, maximum %d). Please filter and retry.")
+                    % (len(bo_lines), _MAX_WIZARD_LINES)
+                )
+
             self._check_valid_blanket_order_line(bo_lines)
 
-            lines = []
-            for bol in bo_lines.filtered(
-                lambda line: not line.display_type and line.remaining_uom_qty > 0.0
-            ):
-                try:
-                    line_vals = {
-                        "blanket_line_id": bol.id,
-                        "date_schedule": bol.date_schedule or fields.Date.context_today(self),
-                        "qty": bol.remaining_uom_qty,  # Vorschlag: Komplette verfügbare Menge
-                    }
-                    
-                    lines.append(fields.Command.create(line_vals))
-                    
-                except Exception as e:
-                    _logger.warning(
-                        "Fehler beim Erstellen der Wizard Line für %s: %s", 
-                        bol.id, str(e)
-                    )
-                    continue
+            # Abschnitte/Notizen und ausgeschöpfte Zeilen direkt in der Datenbank
+            # aussortieren, statt alle Zeilen zu laden und in Python zu filtern
+            blanket_order_line_obj.flush_model(["display_type", "remaining_uom_qty", "date_schedule"])
+            self.env.cr.execute(
+                """
+                SELECT id, date_schedule, remaining_uom_qty
+                  FROM sale_blanket_order_line
+                 WHERE id IN %s
+                   AND display_type IS NULL
+                   AND remaining_uom_qty > 0
+                """,
+                (tuple(bo_lines.ids),),
+            )
+            rows = {row[0]: row for row in self.env.cr.fetchall()}
+
+            # Reihenfolge der Auswahl beibehalten
+            today = fields.Date.context_today(self)
+            lines = [
+                (0, 0, {
+                    "blanket_line_id": line_id,
+                    "date_schedule": rows[line_id][1] or today,
+                    "qty": rows[line_id][2],  # Vorschlag: Komplette verfügbare Menge
+                })
+                for line_id in bo_lines.ids
+                if line_id in rows
+            ]
 
             _logger.info("Generiert %d Wizard Lines", len(lines))
             return lines
@@ -380,17 +490,22 @@ class BlanketOrderWizard(models.TransientModel):
         """Berechne Summary-Informationen"""
         for wizard in self:
             try:
-                valid_lines = wizard.line_ids.filtered(lambda l: l.qty > 0)
-                wizard.line_count = len(valid_lines)
-                
-                if valid_lines:
-                    # Nehme Währung der ersten Linie
-                    wizard.currency_id = valid_lines[0].currency_id
-                    wizard.total_amount = sum(line.price_subtotal for line in valid_lines)
-                else:
-                    wizard.currency_id = False
-                    wizard.total_amount = 0.0
-                    
+                # Ein Durchlauf: Anzahl, Summe und Währung der ersten gültigen Zeile
+                count = 0
+                total = 0.0
+                currency = False
+                for line in wizard.line_ids:
+                    qty = line.qty
+                    if qty > 0:
+                        count += 1
+                        # Direkt rechnen statt den price_subtotal-Compute auszulösen
+                        total += qty * line.price_unit
+                        if not currency:
+                            currency = line.currency_id
+                wizard.line_count = count
+                wizard.total_amount = total
+                wizard.currency_id = currency
+
             except Exception as e:
                 _logger.warning("Fehler bei Summary-Berechnung: %s", str(e))
                 wizard.line_count = 0
@@ -411,33 +526,56 @@ class BlanketOrderWizard(models.TransientModel):
         - Tax-Synchronisation
         - Defensive Programming
         """
-        if not line.blanket_line_id:
+        return self._prepare_so_line_vals_batch(line)[0]
+
+    def _prepare_so_line_vals_batch(self, lines):
+        """
+        Sale Order Line Values für mehrere Wizard Lines vorbereiten
+
+        Alle Blanket Lines werden mit einem read() gelesen; die Werte kommen
+        in der Reihenfolge von lines zurück.
+        """
+        if lines.filtered(lambda line: not line.blanket_line_id):
             raise UserError(_("Wizard line has no associated blanket order line."))
 
         try:
-            blanket_line = line.blanket_line_id
-            
-            vals = {
-                "product_id": blanket_line.product_id.id if blanket_line.product_id else False,
-                "name": blanket_line.name or (blanket_line.product_id.name if blanket_line.product_id else _("Unknown Product")),
-                "product_uom": blanket_line.product_uom.id if blanket_line.product_uom else False,
-                "sequence": getattr(blanket_line, 'sequence', 10),
-                "price_unit": blanket_line.price_unit or 0.0,
-                "blanket_order_line": blanket_line.id,
-                "product_uom_qty": line.qty or 0.0,
+            # load=None liefert rohe IDs statt (id, display_name)-Paaren
+            blanket_data = {
+                row["id"]: row
+                for row in lines.blanket_line_id.read(
+                    ["product_id", "name", "product_uom", "sequence", "price_unit", "taxes_id"],
+                    load=None,
+                )
             }
 
-            if hasattr(line, 'analytic_distribution') and line.analytic_distribution:
-                vals["analytic_distribution"] = line.analytic_distribution
+            vals_list = []
+            for line in lines:
+                blanket_line_id = line.blanket_line_id.id
+                row = blanket_data[blanket_line_id]
+                product_id = row["product_id"]
+                vals = {
+                    "product_id": product_id,
+                    "name": row["name"] or (line.product_id.name if product_id else _("Unknown Product")),
+                    "product_uom": row["product_uom"],
+                    "sequence": row["sequence"] or 10,
+                    "price_unit": row["price_unit"] or 0.0,
+                    "blanket_order_line": blanket_line_id,
+                    "product_uom_qty": line.qty or 0.0,
+                }
+
+                # Feld kommt über analytic.mixin, hasattr() ist nicht nötig
+                if line.analytic_distribution:
+                    vals["analytic_distribution"] = line.analytic_distribution
 
-            if blanket_line.taxes_id:
-                vals["tax_id"] = [fields.Command.set(blanket_line.taxes_id.ids)]
+                if row["taxes_id"]:
+                    vals["tax_id"] = [(6, 0, row["taxes_id"])]
 
+                if line.date_schedule:
+                    vals["commitment_date"] = line.date_schedule
 
-            if line.date_schedule:
-                vals["commitment_date"] = line.date_schedule
+                vals_list.append(vals)
 
-            return vals
+            return vals_list
             
         except Exception as e:
             _logger.error("Fehler bei _prepare_so_line_vals: %s", str(e))
@@ -445,6 +583,82 @@ class BlanketOrderWizard(models.TransientModel):
                 _("Error preparing sale order line values: %s") % str(e)
             )
 
+    def _prepare_so_base_vals(self, currency_id=None):
+        """
+        Kundenunabhängige Sale Order Werte aus der Blanket Order
+
+        Wird einmal pro Wizard-Lauf berechnet und in jede Sale Order übernommen.
+        Eine bereits per _check_currency_uniformity ermittelte currency_id
+        wird übernommen statt erneut gelesen.
+        """
+        blanket_order = self.blanket_order_id
+        base_vals = {}
+        for src, dst in _SO_FIELDS_FROM_BLANKET:
+            value = blanket_order[src]
+            if value:
+                base_vals[dst] = value.id
+        if currency_id is None:
+            currency_id = blanket_order.currency_id.id
+        if currency_id:
+            base_vals["currency_id"] = currency_id
+        # Feld kommt über analytic.mixin
+        if blanket_order.analytic_distribution:
+            base_vals["analytic_distribution"] = blanket_order.analytic_distribution
+        return base_vals
+
+    def _check_currency_uniformity(self, blanket_line_ids):
+        """
+        Währungs-Konsistenz der Blanket Lines prüfen
+
+        Zählt die verschiedenen Währungen der zugehörigen Blanket Orders per
+        SQL und liefert im selben Query die einzige currency_id (False, wenn
+        keine gesetzt ist); bei mehr als einer Währung wird ein UserError
+        ausgelöst.
+        """
+        if not blanket_line_ids:
+            return False
+
+        # Ausstehende ORM-Änderungen schreiben, bevor direkt gelesen wird
+        self.env["sale.blanket.order.line"].flush_model(["order_id"])
+        self.env["sale.blanket.order"].flush_model(["currency_id"])
+        self.env.cr.execute(
+            """
+            SELECT COUNT(DISTINCT sbo.currency_id), MIN(sbo.currency_id)
+              FROM sale_blanket_order_line sbol
+              JOIN sale_blanket_order sbo ON sbol.order_id = sbo.id
+             WHERE sbol.id IN %s
+            """,
+            (tuple(blanket_line_ids),),
+        )
+        currency_count, currency_id = self.env.cr.fetchone()
+        if currency_count > 1:
+            raise UserError(
+                _("Cannot create sale orders from blanket order lines with different currencies")
+            )
+        return currency_id or False
+
+    def _get_customer_addresses(self, customers):
+        """
+        Rechnungs- und Lieferadressen für mehrere Kunden auf einmal ermitteln
+
+        Liefert {partner_id: {'invoice': id, 'delivery': id}}. Partner ohne
+        Hierarchie werden ohne address_get() auf sich selbst abgebildet.
+        """
+        # Hierarchie-Felder aller Kunden in einem SELECT laden
+        customers.fetch(["parent_id", "child_ids"])
+        addr_map = {}
+        for customer in customers:
+            if not customer.parent_id and not customer.child_ids:
+                # Einzelpartner ohne Hierarchie: address_get() liefert ohnehin
+                # den Partner selbst, die Baumsuche kann entfallen
+                addr_map[customer.id] = {'invoice': customer.id, 'delivery': customer.id}
+                continue
+            try:
+                addr_map[customer.id] = customer.address_get(['delivery', 'invoice'])
+            except Exception as addr_error:
+                _logger.warning("Fehler bei Adress-Ermittlung: %s", str(addr_error))
+        return addr_map
+
     def _prepare_so_vals(self, customer_id, global_values):
         """
         Sale Order Values vorbereiten
@@ -467,30 +681,20 @@ class BlanketOrderWizard(models.TransientModel):
                 "order_line": global_values["order_lines_by_customer"].get(customer_id, []),
             }
 
-            if blanket_order.user_id:
-                vals["user_id"] = blanket_order.user_id.id
-            if blanket_order.currency_id:
-                vals["currency_id"] = blanket_order.currency_id.id
-            if blanket_order.pricelist_id:
-                vals["pricelist_id"] = blanket_order.pricelist_id.id
-            if blanket_order.payment_term_id:
-                vals["payment_term_id"] = blanket_order.payment_term_id.id
-            if blanket_order.team_id:
-                vals["team_id"] = blanket_order.team_id.id
-            if blanket_order.company_id:
-                vals["company_id"] = blanket_order.company_id.id
-
-            if hasattr(blanket_order, 'analytic_distribution') and blanket_order.analytic_distribution:
-                vals["analytic_distribution"] = blanket_order.analytic_distribution
+            base_vals = global_values.get("base_vals")
+            if base_vals is None:
+                base_vals = self._prepare_so_base_vals()
+            vals.update(base_vals)
 
-            try:
-                addr = customer.address_get(['delivery', 'invoice'])
+            addr_map = global_values.get("addr_map")
+            if addr_map is None:
+                addr_map = self._get_customer_addresses(customer)
+            addr = addr_map.get(customer_id)
+            if addr is not None:
                 vals.update({
                     "partner_invoice_id": addr.get('invoice', customer_id),
                     "partner_shipping_id": addr.get('delivery', customer_id),
                 })
-            except Exception as addr_error:
-                _logger.warning("Fehler bei Adress-Ermittlung: %s", str(addr_error))
 
             return vals
             
@@ -518,69 +722,91 @@ class BlanketOrderWizard(models.TransientModel):
         if not valid_lines:
             raise UserError(_("No lines with quantity > 0 selected."))
 
+        # Cache für alle im Loop benötigten Felder in wenigen SELECTs vorwärmen,
+        # statt sie pro Zeile über related-Felder einzeln nachzuladen
+        valid_lines.fetch(["qty", "date_schedule", "blanket_line_id"])
+        valid_lines.blanket_line_id.fetch([
+            "product_id", "name", "product_uom", "sequence", "price_unit", "taxes_id",
+            "partner_id", "remaining_uom_qty", "analytic_distribution",
+        ])
+
         try:
-            # Nach Customer gruppieren
-            order_lines_by_customer = defaultdict(list)
-            currencies = set()
-            
-            for line in valid_lines:
-                # Mengen-Validierung
-                if line.qty > line.remaining_uom_qty:
-                    raise UserError(
-                        _("Cannot order %.3f of %s - only %.3f remaining") 
-                        % (line.qty, line.product_id.name, line.remaining_uom_qty)
-                    )
-
-                # Sale Order Line vorbereiten
-                line_vals = self._prepare_so_line_vals(line)
-                customer_id = line.partner_id.id if line.partner_id else False
-                
+            # Feldwerte einmal für alle Zeilen auslesen statt pro Iteration
+            qtys = valid_lines.mapped("qty")
+            remainings = valid_lines.mapped("remaining_uom_qty")
+            customer_ids = valid_lines.mapped(lambda line: line.partner_id.id)
+
+            # Nach Customer gruppieren: Listen vorab in finaler Größe anlegen
+            # und per Positionszähler befüllen. Counter behält die Reihenfolge
+            # des ersten Auftretens, die Sale Orders entstehen also
+            # deterministisch in Zeilenreihenfolge.
+            order_lines_by_customer = {
+                cid: [None] * count for cid, count in Counter(customer_ids).items()
+            }
+            fill_pos = dict.fromkeys(order_lines_by_customer, 0)
+
+            # Mengen-Validierung für alle Zeilen auf einmal
+            over_limit = _find_qty_violations(qtys, remainings, 0.0)
+            if over_limit:
+                idx = over_limit[0]
+                raise UserError(
+                    _("Cannot order %.3f of %s - only %.3f remaining") 
+                    % (qtys[idx], valid_lines[idx].product_id.name, remainings[idx])
+                )
+
+            # Sale Order Lines in einem Durchgang vorbereiten
+            all_line_vals = self._prepare_so_line_vals_batch(valid_lines)
+
+            for customer_id, line_vals in zip(customer_ids, all_line_vals):
                 if not customer_id:
                     raise UserError(_("Line has no associated customer."))
 
-                order_lines_by_customer[customer_id].append((0, 0, line_vals))
-                
-                # Währungs-Konsistenz tracken
-                if line.currency_id:
-                    currencies.add(line.currency_id.id)
+                pos = fill_pos[customer_id]
+                order_lines_by_customer[customer_id][pos] = (0, 0, line_vals)
+                fill_pos[customer_id] = pos + 1
 
             if not order_lines_by_customer:
                 raise UserError(_("No valid order lines to create."))
 
-            # Multi-Currency Validation
-            if len(currencies) > 1:
+            # Multi-Currency Validation komplett in der Datenbank; die
+            # ermittelte Währung geht direkt in die Sale Orders
+            currency_id = self._check_currency_uniformity(valid_lines.blanket_line_id.ids)
+
+            # Sale Orders in einem einzigen create() erstellen (Batch-INSERT)
+            global_values = {
+                "order_lines_by_customer": order_lines_by_customer,
+                "base_vals": self._prepare_so_base_vals(currency_id),
+                "addr_map": self._get_customer_addresses(
+                    self.env["res.partner"].browse(list(order_lines_by_customer))
+                ),
+            }
+            all_vals = [
+                self._prepare_so_vals(customer_id, global_values)
+                for customer_id in order_lines_by_customer
+            ]
+
+            # Savepoint: schlägt create() fehl, wird nur dieser Schritt
+            # zurückgerollt. Mail-Tracking und Follower-Abos sind beim
+            # Massen-Anlegen der teuerste Teil und werden abgeschaltet.
+            sale_order_obj = self.env["sale.order"].with_context(
+                tracking_disable=True,
+                mail_create_nosubscribe=True,
+                mail_create_nolog=True,
+            )
+            try:
+                with self.env.cr.savepoint():
+                    sale_orders = sale_order_obj.create(all_vals)
+            except Exception as so_error:
+                _logger.error("Fehler bei SO-Erstellung: %s", str(so_error))
                 raise UserError(
-                    _("Cannot create sale orders from blanket order lines with different currencies")
+                    _("Error creating sale orders: %s") % str(so_error)
                 )
-
-            # Sale Orders erstellen
-            created_orders = []
-            global_values = {"order_lines_by_customer": order_lines_by_customer}
-            
-            for customer_id in order_lines_by_customer:
-                try:
-                    order_vals = self._prepare_so_vals(customer_id, global_values)
-                    sale_order = self.env["sale.order"].create(order_vals)
-                    created_orders.append(sale_order.id)
-                    
-                    _logger.info(
-                        "Sale Order %s erstellt für Customer %s (Zeilen: %d)", 
-                        sale_order.name, customer_id, len(order_lines_by_customer[customer_id])
-                    )
-                    
-                except Exception as so_error:
-                    _logger.error("Fehler bei SO-Erstellung für Customer %s: %s", customer_id, str(so_error))
-                    raise UserError(
-                        _("Error creating sale order for customer %s: %s") 
-                        % (customer_id, str(so_error))
-                    )
+            created_orders = sale_orders.ids
 
             if not created_orders:
                 raise UserError(_("No sale orders could be created."))
 
-            # Success Feedback
-            success_message = _("Successfully created %d sale order(s)") % len(created_orders)
-            _logger.info(success_message)
+            _logger.info("%d Sale Order(s) erstellt: %s", len(created_orders), created_orders)
 
             # Return Action
             if len(created_orders) == 1:
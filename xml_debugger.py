@@ -37,13 +37,207 @@ import re
 import xml.etree.ElementTree as ET
 from xml.dom import minidom
 import logging
+import logging.handlers
 import argparse
 import sys
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, NamedTuple, Tuple, Optional
+from bisect import bisect_left
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 import shutil
 import json
+import codecs
+import hashlib
+import io
+import mmap
+
+# lxml parst in C und deutlich schneller; ohne lxml bleibt ElementTree
+try:
+    from lxml import etree as _ET
+    _XML_PARSE_ERRORS = (_ET.XMLSyntaxError,)
+except ImportError:
+    _ET = ET
+    _XML_PARSE_ERRORS = (ET.ParseError,)
+
+try:
+    import numpy as np
+except ImportError:  # optional: ohne numpy bleibt es bei find()/bisect
+    np = None
+
+
+# Vorkompilierte Muster, einmal pro Prozess statt pro Aufruf.
+# Alle Muster sind ASCII und arbeiten direkt auf den Rohbytes der Datei.
+_RE_DATA_OPEN = re.compile(rb'<data[^>]*>')
+# Gruppe 1: Attribute des <data> Tags, Gruppe 2: Inhalt des Blocks
+_RE_DATA_BLOCK = re.compile(rb'<data([^>]*)>(.*?)</data>', re.DOTALL)
+_RE_XML_DECL = re.compile(rb'<\?xml[^>]*\?>')
+# Nur das Tag-Präfix ist relevant; \b schließt z.B. <records> aus
+_RE_CONTENT = re.compile(rb'<(?:record|menuitem|template)\b')
+_RE_SPACE_INDENT = re.compile(rb'^[ ]+', re.MULTILINE)
+# Leerzeichen/Tabs am Zeilenende, auch in der letzten Zeile ohne Umbruch
+_RE_TRAILING_WS = re.compile(rb'[ \t]+(?=\r?\n|\Z)')
+_UTF8_BOM = b'\xef\xbb\xbf'
+
+# Ab dieser Größe wird eine Datei zur Analyse per mmap eingeblendet statt
+# gelesen. mmap kennt weder count() noch einen Teilstring-Test per "in",
+# die Prüfungen nutzen daher nur find(), Slicing und Regex.
+_MMAP_MIN_SIZE = 64 * 1024
+
+# Blockgröße für Durchläufe, die sonst eine Kopie in Dateigröße anlegen
+# würden (UTF-8-Prüfung, numpy-Zeilenumbrüche); hält mmap speicherkonstant
+_CHUNK_SIZE = 256 * 1024
+
+# Persistenter Analyse-Cache unter $XDG_CACHE_HOME (bzw. ~/.cache), eine Datei
+# je Modul: {relativer Pfad: [mtime_ns, Größe, Analyse]}; bei
+# Formatänderungen Version erhöhen
+_CACHE_DIR_NAME = 'xml_debugger'
+_CACHE_VERSION = 1
+
+# Tags für die vereinfachte Balance-Prüfung, alle in einem Durchlauf:
+# Gruppe 'open' für öffnende (nicht selbstschließende), 'close' für schließende Tags
+_NESTING_TAGS = ('record', 'field', 'tree', 'form', 'search', 'menuitem')
+_NESTING_ALT = '|'.join(_NESTING_TAGS)
+_RE_NESTING = re.compile(
+    f'<(?P<open>{_NESTING_ALT})[^>]*(?<!/)>|</(?P<close>{_NESTING_ALT})>'.encode('ascii')
+)
+
+
+def _cache_path(module_path: Path) -> Path:
+    """Cache-Datei eines Moduls, außerhalb des Moduls je aufgelöstem Modulpfad"""
+    cache_root = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    digest = hashlib.sha1(str(module_path.resolve()).encode('utf-8')).hexdigest()
+    return Path(cache_root) / _CACHE_DIR_NAME / f'{digest}.json'
+
+
+def _find_all(content: bytes, needle: bytes) -> List[int]:
+    """Start-Offsets aller Vorkommen von needle in content (aufsteigend)"""
+    offsets = []
+    pos = content.find(needle)
+    while pos != -1:
+        offsets.append(pos)
+        pos = content.find(needle, pos + 1)
+    return offsets
+
+
+def _count(content: bytes, needle: bytes) -> int:
+    """Anzahl nicht überlappender Vorkommen von needle, auch für mmap"""
+    if isinstance(content, bytes):
+        return content.count(needle)
+    count = 0
+    pos = content.find(needle)
+    while pos != -1:
+        count += 1
+        pos = content.find(needle, pos + len(needle))
+    return count
+
+
+def _newline_offsets(content: bytes):
+    """
+    Offsets aller Zeilenumbrüche in content (aufsteigend)
+    
+    Mit numpy als Array aus einem vektorisierten Byte-Vergleich (auch direkt
+    auf mmap, blockweise ohne Maske in Dateigröße), sonst als Liste per
+    find()-Schleife.
+    """
+    if np is not None:
+        data = np.frombuffer(content, dtype=np.uint8)
+        starts = range(0, len(data), _CHUNK_SIZE)
+        # Erst zählen, dann in ein Array in Endgröße füllen (kein concatenate)
+        counts = [np.count_nonzero(data[start:start + _CHUNK_SIZE] == 0x0A) for start in starts]
+        offsets = np.empty(sum(counts), dtype=np.intp)
+        pos = 0
+        for start, count in zip(starts, counts):
+            offsets[pos:pos + count] = np.flatnonzero(data[start:start + _CHUNK_SIZE] == 0x0A) + start
+            pos += count
+        return offsets
+    return _find_all(content, b'\n')
+
+
+def _utf8_error(content: bytes) -> Optional[str]:
+    """
+    Meldung zum ersten UTF-8-Fehler in content (wie str(content, 'utf-8')), sonst None
+    
+    Dekodiert blockweise mit einem inkrementellen Decoder; für mmap entsteht
+    so keine Kopie der ganzen Datei als String.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    size = len(content)
+    for start in range(0, size, _CHUNK_SIZE):
+        # Unvollständige Zeichen vom Blockende puffert der Decoder und stellt
+        # sie dem nächsten Block voran - Positionen sind relativ zu beidem
+        pending = len(decoder.getstate()[0])
+        end = start + _CHUNK_SIZE
+        try:
+            decoder.decode(content[start:end], final=end >= size)
+        except UnicodeDecodeError as e:
+            pos = start - pending + e.start
+            if e.end - e.start == 1:
+                return (f"'{e.encoding}' codec can't decode byte 0x{e.object[e.start]:02x} "
+                        f"in position {pos}: {e.reason}")
+            return (f"'{e.encoding}' codec can't decode bytes in position "
+                    f"{pos}-{pos + e.end - e.start - 1}: {e.reason}")
+    return None
+
+
+def _line_of(nl_offsets: List[int], pos: int) -> int:
+    """1-basierte Zeilennummer eines Offsets per Binärsuche"""
+    return bisect_left(nl_offsets, pos) + 1
+
+
+def _lines_of(nl_offsets, positions: List[int]) -> List[int]:
+    """1-basierte Zeilennummern mehrerer Offsets in einem Aufruf"""
+    if np is not None and isinstance(nl_offsets, np.ndarray):
+        return (np.searchsorted(nl_offsets, positions, side='left') + 1).tolist()
+    return [_line_of(nl_offsets, pos) for pos in positions]
+
+
+class Issue(NamedTuple):
+    """Ein gefundenes Problem; leichter als ein Dict pro Issue"""
+    type: str
+    message: str
+    fix: Optional[str] = None
+    auto_fixable: Optional[bool] = None
+    line_info: Optional[List] = None
+    fix_key: Optional[str] = None
+    
+    def as_dict(self) -> Dict:
+        """Dict-Form für den JSON-Export; nicht gesetzte Felder entfallen"""
+        return {key: value for key, value in self._asdict().items() if value is not None}
+
+
+def _analysis_as_json(analysis: Dict) -> Dict:
+    """Analyse mit Issues als Dicts (json serialisiert NamedTuples als Listen)"""
+    return dict(analysis, issues=[issue.as_dict() for issue in analysis.get('issues', [])])
+
+
+def _analysis_from_json(analysis: Dict) -> Dict:
+    """Gegenstück zu _analysis_as_json, z.B. für Einträge aus dem Cache"""
+    return dict(analysis, issues=[Issue(**issue) for issue in analysis.get('issues', [])])
+
+
+def _fast_backup(src: Path, dst: Path):
+    """
+    Kopiert nur den Dateiinhalt (ohne Metadaten) für ein Backup
+    
+    Unter Linux per os.copy_file_range direkt im Kernel, sonst bzw. wenn
+    das Dateisystem es nicht unterstützt per shutil.copyfile.
+    """
+    copy_file_range = getattr(os, 'copy_file_range', None)
+    if copy_file_range is not None:
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
 
 
 class OdooXMLDebugger:
@@ -54,18 +248,28 @@ class OdooXMLDebugger:
     die in Odoo 18.0 zu Validierungsfehlern führen.
     """
     
-    def __init__(self, auto_fix: bool = False, create_backup: bool = True):
+    def __init__(self, auto_fix: bool = False, create_backup: bool = True,
+                 use_cache: bool = True, save_cache: bool = True):
         self.auto_fix = auto_fix
         self.create_backup = create_backup
+        self.use_cache = use_cache
+        # Bei reiner Validierung wird der Cache gelesen, aber nicht geschrieben
+        self.save_cache = save_cache
         self.issues_found = []
         self.fixes_applied = []
         
-        # Setup Logging
+        # Setup Logging; die Logdatei wird gepuffert geschrieben und erst
+        # bei WARNING oder vollem Puffer (bzw. Programmende) geleert
+        log_format = '%(asctime)s - %(levelname)s - %(message)s'
+        file_handler = logging.FileHandler(f'xml_debug_{datetime.now().strftime("%Y%m%d")}.log')
+        file_handler.setFormatter(logging.Formatter(log_format))
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
+            format=log_format,
             handlers=[
-                logging.FileHandler(f'xml_debug_{datetime.now().strftime("%Y%m%d")}.log'),
+                logging.handlers.MemoryHandler(
+                    capacity=1024, flushLevel=logging.WARNING, target=file_handler
+                ),
                 logging.StreamHandler()
             ]
         )
@@ -95,9 +299,29 @@ class OdooXMLDebugger:
             Dict: Detaillierte Analyse-Ergebnisse
         """
         try:
-            with open(xml_file, 'r', encoding='utf-8') as f:
+            with open(xml_file, 'rb') as f:
+                # Große Dateien nur einblenden; das OS lädt Seiten bei Bedarf
+                if os.fstat(f.fileno()).st_size >= _MMAP_MIN_SIZE:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                        return self.analyze_xml_content(content, xml_file)
                 content = f.read()
+        except Exception as e:
+            return self._failed_analysis(xml_file, e)
+        
+        return self.analyze_xml_content(content, xml_file)
+    
+    def analyze_xml_content(self, content: bytes, xml_file: Path) -> Dict:
+        """
+        Analysiert bereits gelesenen XML-Inhalt auf Strukturprobleme
+        
+        Args:
+            content: Rohbytes der XML-Datei
+            xml_file: Pfad zur XML-Datei (für Meldungen)
             
+        Returns:
+            Dict: Detaillierte Analyse-Ergebnisse
+        """
+        try:
             analysis = {
                 'file': str(xml_file),
                 'valid': True,
@@ -106,73 +330,115 @@ class OdooXMLDebugger:
                 'recommendations': []
             }
             
-            # 1. BASIC STRUCTURE CHECKS
-            self._check_basic_structure(content, analysis)
+            # 1. XML PARSING TEST (ein Streaming-Durchlauf über den Inhalt)
+            parse_issue, root = self._test_xml_parsing(content, xml_file, analysis)
+            
+            # Schnellpfad: bei wohlgeformtem XML mit <odoo> Root, höchstens einem
+            # direkten <data> und keinen weiteren Tag-Literalen (z.B. in Kommentaren)
+            # können die Balance- und Platzierungsprüfungen nichts finden
+            well_formed = parse_issue is None and self._fast_validate(content, root)
+            
+            # 2. BASIC STRUCTURE CHECKS
+            if not well_formed:
+                self._check_basic_structure(content, analysis)
             
-            # 2. DATA TAG VALIDATION
-            self._check_data_tags(content, analysis)
+            # 3. DATA TAG VALIDATION
+            self._check_data_tags(content, analysis, well_formed)
             
-            # 3. XML DECLARATION
+            # 4. XML DECLARATION
             self._check_xml_declaration(content, analysis)
             
-            # 4. ENCODING ISSUES
+            # 5. ENCODING ISSUES
             self._check_encoding_issues(content, analysis)
             
-            # 5. WHITESPACE PROBLEMS
+            # 6. WHITESPACE PROBLEMS
             self._check_whitespace_issues(content, analysis)
             
-            # 6. NESTING VALIDATION
-            self._check_nesting_issues(content, analysis)
-            
-            # 7. XML PARSING TEST
-            self._test_xml_parsing(content, analysis)
+            # 7. NESTING VALIDATION
+            # Wohlgeformtes XML ist per Definition balanciert; die Regex-Zählung
+            # ist nur aussagekräftig, wenn der Parser gescheitert ist
+            if parse_issue:
+                self._check_nesting_issues(content, analysis)
+                analysis['issues'].append(parse_issue)
             
             return analysis
             
         except Exception as e:
-            self.logger.error(f"❌ Fehler bei Analyse von {xml_file}: {e}")
-            return {
-                'file': str(xml_file),
-                'valid': False,
-                'error': str(e),
-                'issues': [{'type': 'CRITICAL', 'message': f'Datei kann nicht gelesen werden: {e}'}]
-            }
+            return self._failed_analysis(xml_file, e)
+    
+    def _fast_validate(self, content: bytes, root: Tuple[str, int]) -> bool:
+        """
+        Prüft für bereits erfolgreich geparste Dateien, ob die strukturellen
+        Prüfungen übersprungen werden können: Root ist <odoo> mit höchstens
+        einem direkten <data> Kind, und im Text stehen keine weiteren
+        <odoo>/<data> Literale (z.B. in Kommentaren oder CDATA). Alles andere
+        läuft weiterhin durch die vollständige Prüfung.
+        
+        Args:
+            content: Rohbytes der XML-Datei
+            root: (Root-Tag, Anzahl direkter <data> Kinder) aus _test_xml_parsing
+        """
+        root_tag, data_children = root
+        if root_tag != 'odoo' or data_children > 1:
+            return False
+        if _count(content, b'<odoo') != 1 or _count(content, b'<data') != data_children:
+            return False
+        # Auch schließende Tags dürfen nur einmal vorkommen (selbstschließend: keinmal)
+        return _count(content, b'</odoo>') == 1 - _count(content, b'<odoo/')
+    
+    def _read_xml(self, xml_file: Path) -> bytes:
+        """Liest eine XML-Datei einmalig als Rohbytes ein"""
+        with open(xml_file, 'rb') as f:
+            return f.read()
     
-    def _check_basic_structure(self, content: str, analysis: Dict):
+    def _failed_analysis(self, xml_file: Path, error: Exception) -> Dict:
+        """Analyse-Ergebnis für Dateien, die nicht gelesen werden können"""
+        self.logger.error("❌ Fehler bei Analyse von %s: %s", xml_file, error)
+        return {
+            'file': str(xml_file),
+            'valid': False,
+            'error': str(error),
+            'issues': [Issue('CRITICAL', f'Datei kann nicht gelesen werden: {error}')]
+        }
+    
+    def _check_basic_structure(self, content: bytes, analysis: Dict):
         """Prüft die grundlegende XML-Struktur"""
         issues = []
         
-        # Prüfe <odoo> Root Element
-        odoo_pattern = r'<odoo[^>]*>'
-        odoo_matches = re.findall(odoo_pattern, content)
-        
-        if len(odoo_matches) == 0:
-            issues.append({
-                'type': 'CRITICAL',
-                'message': 'Kein <odoo> Root-Element gefunden',
-                'fix': 'Füge <odoo> Root-Element hinzu'
-            })
-        elif len(odoo_matches) > 1:
-            issues.append({
-                'type': 'CRITICAL', 
-                'message': f'Mehrere <odoo> Root-Elemente gefunden: {len(odoo_matches)}',
-                'fix': 'Entferne doppelte <odoo> Tags'
-            })
+        # Prüfe <odoo> Root Element; reine Literale, str.count genügt
+        odoo_count = _count(content, b'<odoo')
+        # Selbstschließendes <odoo/> braucht kein </odoo>
+        odoo_open_count = odoo_count - _count(content, b'<odoo/')
+        
+        if odoo_count == 0:
+            issues.append(Issue(
+                type='CRITICAL',
+                message='Kein <odoo> Root-Element gefunden',
+                fix='Füge <odoo> Root-Element hinzu',
+                auto_fixable=True,
+                fix_key='no_root'
+            ))
+        elif odoo_count > 1:
+            issues.append(Issue(
+                type='CRITICAL',
+                message=f'Mehrere <odoo> Root-Elemente gefunden: {odoo_count}',
+                fix='Entferne doppelte <odoo> Tags'
+            ))
         
         # Prüfe </odoo> Closing Tag
-        odoo_close_count = content.count('</odoo>')
-        if odoo_close_count != len(odoo_matches):
-            issues.append({
-                'type': 'CRITICAL',
-                'message': f'Unausgewogene <odoo> Tags: {len(odoo_matches)} öffnende, {odoo_close_count} schließende',
-                'fix': 'Korrigiere <odoo> Tag-Balance'
-            })
+        odoo_close_count = _count(content, b'</odoo>')
+        if odoo_close_count != odoo_open_count:
+            issues.append(Issue(
+                type='CRITICAL',
+                message=f'Unausgewogene <odoo> Tags: {odoo_open_count} öffnende, {odoo_close_count} schließende',
+                fix='Korrigiere <odoo> Tag-Balance'
+            ))
         
         analysis['issues'].extend(issues)
         if issues:
             analysis['valid'] = False
     
-    def _check_data_tags(self, content: str, analysis: Dict):
+    def _check_data_tags(self, content: bytes, analysis: Dict, well_formed: bool = False):
         """
         Prüft <data> Tag Struktur - HAUPTURSACHE des Fehlers!
         
@@ -180,286 +446,355 @@ class OdooXMLDebugger:
         - Mehrere <data> Tags auf der gleichen Ebene
         - <data> Tag außerhalb von <odoo>
         - Fehlende <data> Tags
+        
+        Bei well_formed (siehe _fast_validate) entfällt die Platzierungsprüfung.
         """
         issues = []
         
         # Finde alle <data> Tags
-        data_pattern = r'<data[^>]*>'
-        data_matches = list(re.finditer(data_pattern, content))
+        # Regex-Durchlauf nur, wenn das Literal überhaupt vorkommt
+        data_matches = list(_RE_DATA_OPEN.finditer(content)) if content.find(b'<data') != -1 else []
         
         # Finde alle </data> Tags
-        data_close_count = content.count('</data>')
+        data_close_count = _count(content, b'</data>')
         
-        self.logger.debug(f"Gefundene <data> Tags: {len(data_matches)}, </data> Tags: {data_close_count}")
+        self.logger.debug("Gefundene <data> Tags: %d, </data> Tags: %d", len(data_matches), data_close_count)
+        
+        # Zeilennummern aller <data> Tags einmal per Binärsuche bestimmen,
+        # statt für jeden Treffer den Text bis dahin neu zu zählen
+        nl_offsets = _newline_offsets(content) if data_matches else []
+        data_lines = _lines_of(nl_offsets, [m.start() for m in data_matches])
         
         # Problem 1: Unausgewogene <data> Tags
         if len(data_matches) != data_close_count:
-            issues.append({
-                'type': 'CRITICAL',
-                'message': f'Unausgewogene <data> Tags: {len(data_matches)} öffnende, {data_close_count} schließende',
-                'fix': 'Korrigiere <data> Tag-Balance',
-                'line_info': [content[:m.start()].count('\n') + 1 for m in data_matches]
-            })
+            issues.append(Issue(
+                type='CRITICAL',
+                message=f'Unausgewogene <data> Tags: {len(data_matches)} öffnende, {data_close_count} schließende',
+                fix='Korrigiere <data> Tag-Balance',
+                line_info=list(data_lines)
+            ))
         
         # Problem 2: Mehrere <data> Tags (Hauptproblem!)
         if len(data_matches) > 1:
-            lines = [content[:m.start()].count('\n') + 1 for m in data_matches]
-            issues.append({
-                'type': 'CRITICAL',
-                'message': f'HAUPTPROBLEM: Mehrere <data> Tags gefunden auf Zeilen: {lines}',
-                'fix': 'Konsolidiere zu einem einzigen <data> Tag',
-                'line_info': lines,
-                'auto_fixable': True
-            })
-        
-        # Problem 3: <data> außerhalb von <odoo>
-        for match in data_matches:
-            # Prüfe ob <data> innerhalb von <odoo> ist
-            before_data = content[:match.start()]
-            after_data = content[match.end():]
-            
-            odoo_opens_before = before_data.count('<odoo')
-            odoo_closes_before = before_data.count('</odoo>')
-            
-            # Wenn mehr schließende als öffnende <odoo> Tags vor dem <data>, dann ist es außerhalb
-            if odoo_closes_before >= odoo_opens_before:
-                line_num = before_data.count('\n') + 1
-                issues.append({
-                    'type': 'CRITICAL',
-                    'message': f'<data> Tag außerhalb von <odoo> auf Zeile {line_num}',
-                    'fix': 'Verschiebe <data> Tag innerhalb von <odoo>',
-                    'line_info': [line_num],
-                    'auto_fixable': True
-                })
+            lines = list(data_lines)
+            issues.append(Issue(
+                type='CRITICAL',
+                message=f'HAUPTPROBLEM: Mehrere <data> Tags gefunden auf Zeilen: {lines}',
+                fix='Konsolidiere zu einem einzigen <data> Tag',
+                line_info=lines,
+                auto_fixable=True,
+                fix_key='multi_data'
+            ))
+        
+        # Problem 3: <data> außerhalb von <odoo> (wohlgeformt mit einem
+        # <odoo> Root liegt jedes <data> darin)
+        # Positionen aller <odoo>/</odoo> einmal sammeln; die Anzahl vor einem
+        # <data> ergibt sich per Binärsuche statt durch erneutes Zählen
+        if data_matches and not well_formed:
+            odoo_opens = _find_all(content, b'<odoo')
+            odoo_closes = _find_all(content, b'</odoo>')
+            for match, line_num in zip(data_matches, data_lines):
+                # Prüfe ob <data> innerhalb von <odoo> ist
+                odoo_opens_before = bisect_left(odoo_opens, match.start())
+                odoo_closes_before = bisect_left(odoo_closes, match.start())
+                
+                # Wenn mehr schließende als öffnende <odoo> Tags vor dem <data>, dann ist es außerhalb
+                if odoo_closes_before >= odoo_opens_before:
+                    issues.append(Issue(
+                        type='CRITICAL',
+                        message=f'<data> Tag außerhalb von <odoo> auf Zeile {line_num}',
+                        fix='Verschiebe <data> Tag innerhalb von <odoo>',
+                        line_info=[line_num],
+                        auto_fixable=True,
+                        fix_key='data_outside'
+                    ))
         
         # Problem 4: Fehlende <data> Tags
         if len(data_matches) == 0:
             # Prüfe ob XML-Inhalt vorhanden ist, der <data> benötigt
-            content_patterns = [r'<record[^>]*>', r'<menuitem[^>]*>', r'<template[^>]*>']
-            has_content = any(re.search(pattern, content) for pattern in content_patterns)
+            has_content = _RE_CONTENT.search(content) is not None
             
             if has_content:
-                issues.append({
-                    'type': 'WARNING',
-                    'message': 'Kein <data> Tag gefunden, aber XML-Inhalt vorhanden',
-                    'fix': 'Füge <data> Container hinzu',
-                    'auto_fixable': True
-                })
+                issues.append(Issue(
+                    type='WARNING',
+                    message='Kein <data> Tag gefunden, aber XML-Inhalt vorhanden',
+                    fix='Füge <data> Container hinzu',
+                    auto_fixable=True,
+                    fix_key='missing_data'
+                ))
         
         analysis['issues'].extend(issues)
         analysis['structure_info']['data_tags'] = {
             'count': len(data_matches),
-            'lines': [content[:m.start()].count('\n') + 1 for m in data_matches]
+            'lines': data_lines
         }
         
-        if any(issue['type'] == 'CRITICAL' for issue in issues):
+        if any(issue.type == 'CRITICAL' for issue in issues):
             analysis['valid'] = False
     
-    def _check_xml_declaration(self, content: str, analysis: Dict):
+    def _check_xml_declaration(self, content: bytes, analysis: Dict):
         """Prüft XML-Deklaration"""
         issues = []
         
         # Prüfe XML-Deklaration
-        xml_decl_pattern = r'<\?xml[^>]*\?>'
-        xml_decl_matches = re.findall(xml_decl_pattern, content)
+        xml_decl_matches = _RE_XML_DECL.findall(content)
         
         if len(xml_decl_matches) == 0:
-            issues.append({
-                'type': 'WARNING',
-                'message': 'Keine XML-Deklaration gefunden',
-                'fix': 'Füge <?xml version="1.0" encoding="utf-8"?> hinzu',
-                'auto_fixable': True
-            })
+            issues.append(Issue(
+                type='WARNING',
+                message='Keine XML-Deklaration gefunden',
+                fix='Füge <?xml version="1.0" encoding="utf-8"?> hinzu',
+                auto_fixable=True,
+                fix_key='xml_decl'
+            ))
         elif len(xml_decl_matches) > 1:
-            issues.append({
-                'type': 'ERROR',
-                'message': f'Mehrere XML-Deklarationen gefunden: {len(xml_decl_matches)}',
-                'fix': 'Entferne doppelte XML-Deklarationen'
-            })
+            issues.append(Issue(
+                type='ERROR',
+                message=f'Mehrere XML-Deklarationen gefunden: {len(xml_decl_matches)}',
+                fix='Entferne doppelte XML-Deklarationen'
+            ))
         
         # Prüfe Encoding
         if xml_decl_matches:
             decl = xml_decl_matches[0]
-            if 'encoding=' not in decl:
-                issues.append({
-                    'type': 'WARNING',
-                    'message': 'Keine Encoding-Deklaration in XML-Header',
-                    'fix': 'Füge encoding="utf-8" hinzu'
-                })
+            if b'encoding=' not in decl:
+                issues.append(Issue(
+                    type='WARNING',
+                    message='Keine Encoding-Deklaration in XML-Header',
+                    fix='Füge encoding="utf-8" hinzu'
+                ))
         
         analysis['issues'].extend(issues)
     
-    def _check_encoding_issues(self, content: str, analysis: Dict):
+    def _check_encoding_issues(self, content: bytes, analysis: Dict):
         """Prüft Encoding-Probleme"""
         issues = []
         
-        # Prüfe auf problematische Zeichen
-        try:
-            content.encode('utf-8')
-        except UnicodeEncodeError as e:
-            issues.append({
-                'type': 'ERROR',
-                'message': f'UTF-8 Encoding-Fehler: {e}',
-                'fix': 'Korrigiere Zeichen-Encoding'
-            })
+        # Prüfe auf problematische Zeichen (Rohbytes müssen gültiges UTF-8 sein)
+        utf8_error = _utf8_error(content)
+        if utf8_error:
+            issues.append(Issue(
+                type='ERROR',
+                message=f'UTF-8 Encoding-Fehler: {utf8_error}',
+                fix='Korrigiere Zeichen-Encoding'
+            ))
         
         # Prüfe auf BOM
-        if content.startswith('\ufeff'):
-            issues.append({
-                'type': 'WARNING',
-                'message': 'BOM (Byte Order Mark) gefunden',
-                'fix': 'Entferne BOM vom Dateianfang',
-                'auto_fixable': True
-            })
+        if content[:len(_UTF8_BOM)] == _UTF8_BOM:
+            issues.append(Issue(
+                type='WARNING',
+                message='BOM (Byte Order Mark) gefunden',
+                fix='Entferne BOM vom Dateianfang',
+                auto_fixable=True,
+                fix_key='bom'
+            ))
         
         analysis['issues'].extend(issues)
     
-    def _check_whitespace_issues(self, content: str, analysis: Dict):
+    def _check_whitespace_issues(self, content: bytes, analysis: Dict):
         """Prüft Whitespace-Probleme"""
         issues = []
         
-        # Prüfe auf Tabs vs Spaces
-        has_tabs = '\t' in content
-        has_spaces = re.search(r'^[ ]+', content, re.MULTILINE)
+        # Prüfe auf Tabs vs Spaces; die Regex-Suche nach Space-Einrückung
+        # ist nur nötig, wenn überhaupt Tabs vorkommen
+        has_tabs = content.find(b'\t') != -1
+        has_spaces = has_tabs and _RE_SPACE_INDENT.search(content)
         
         if has_tabs and has_spaces:
-            issues.append({
-                'type': 'WARNING',
-                'message': 'Gemischte Tabs und Spaces für Einrückung',
-                'fix': 'Vereinheitliche Einrückung (empfohlen: 4 Spaces)',
-                'auto_fixable': True
-            })
-        
-        # Prüfe auf trailing whitespaces
-        lines_with_trailing = []
-        for i, line in enumerate(content.split('\n'), 1):
-            if line.endswith(' ') or line.endswith('\t'):
-                lines_with_trailing.append(i)
-        
-        if lines_with_trailing:
-            issues.append({
-                'type': 'INFO',
-                'message': f'Trailing Whitespaces auf {len(lines_with_trailing)} Zeilen',
-                'fix': 'Entferne trailing Whitespaces',
-                'auto_fixable': True
-            })
+            issues.append(Issue(
+                type='WARNING',
+                message='Gemischte Tabs und Spaces für Einrückung',
+                fix='Vereinheitliche Einrückung (empfohlen: 4 Spaces)',
+                auto_fixable=True,
+                fix_key='whitespace'
+            ))
+        
+        # Prüfe auf Windows-Zeilenenden
+        if content.find(b'\r\n') != -1:
+            issues.append(Issue(
+                type='INFO',
+                message='Windows-Zeilenenden (CRLF) gefunden',
+                fix='Konvertiere zu Unix-Zeilenenden',
+                auto_fixable=True,
+                fix_key='whitespace'
+            ))
+        
+        # Prüfe auf trailing whitespaces; dasselbe Muster wie beim Fix,
+        # ein Treffer je betroffener Zeile
+        trailing_count = len(_RE_TRAILING_WS.findall(content))
+        
+        if trailing_count:
+            issues.append(Issue(
+                type='INFO',
+                message=f'Trailing Whitespaces auf {trailing_count} Zeilen',
+                fix='Entferne trailing Whitespaces',
+                auto_fixable=True,
+                fix_key='whitespace'
+            ))
         
         analysis['issues'].extend(issues)
     
-    def _check_nesting_issues(self, content: str, analysis: Dict):
+    def _check_nesting_issues(self, content: bytes, analysis: Dict):
         """Prüft XML-Verschachtelungsprobleme"""
         issues = []
         
-        # Vereinfachte Tag-Balance-Prüfung für häufige Tags
-        common_tags = ['record', 'field', 'tree', 'form', 'search', 'menuitem']
+        # Vereinfachte Tag-Balance-Prüfung für häufige Tags: ein Scan zählt
+        # öffnende und schließende Tags aller Namen gleichzeitig
+        counts = {'open': Counter(), 'close': Counter()}
+        for match in _RE_NESTING.finditer(content):
+            kind = match.lastgroup
+            counts[kind][match.group(kind).decode('ascii')] += 1
         
-        for tag in common_tags:
-            open_pattern = f'<{tag}[^>]*(?<!/)>'  # Öffnende Tags (nicht selbstschließend)
-            close_pattern = f'</{tag}>'
-            
-            open_count = len(re.findall(open_pattern, content))
-            close_count = len(re.findall(close_pattern, content))
+        for tag in _NESTING_TAGS:
+            open_count = counts['open'][tag]
+            close_count = counts['close'][tag]
             
             if open_count != close_count:
-                issues.append({
-                    'type': 'ERROR',
-                    'message': f'Unausgewogene <{tag}> Tags: {open_count} öffnende, {close_count} schließende',
-                    'fix': f'Korrigiere <{tag}> Tag-Balance'
-                })
+                issues.append(Issue(
+                    type='ERROR',
+                    message=f'Unausgewogene <{tag}> Tags: {open_count} öffnende, {close_count} schließende',
+                    fix=f'Korrigiere <{tag}> Tag-Balance'
+                ))
         
         analysis['issues'].extend(issues)
     
-    def _test_xml_parsing(self, content: str, analysis: Dict):
-        """Testet XML-Parsing mit Python Parser"""
+    def _test_xml_parsing(self, content: bytes, xml_file: Path,
+                          analysis: Dict) -> Tuple[Optional[Issue], Tuple[str, int]]:
+        """
+        Testet XML-Parsing mit lxml (Fallback: ElementTree)
+        
+        Parst streamend per iterparse und verwirft abgeschlossene Elemente
+        sofort, der Speicherbedarf bleibt auch bei großen Dateien konstant.
+        Nebenbei werden Root-Tag und direkte <data> Kinder des Roots gezählt.
+        
+        Returns:
+            Tuple[Optional[Issue], Tuple[str, int]]: Issue bei Parser-Fehler
+            (sonst None) und (Root-Tag, Anzahl direkter <data> Kinder)
+        """
+        root_tag = ''
+        data_children = 0
         try:
-            # Versuche XML zu parsen
-            ET.fromstring(content)
+            if isinstance(content, bytes):
+                source = io.BytesIO(content)
+                source.name = str(xml_file)  # Dateiname für Parser-Meldungen
+            else:
+                # mmap: Parser liest die Datei selbst, ohne Kopie im Speicher
+                source = str(xml_file)
+            depth = 0
+            for event, elem in _ET.iterparse(source, events=('start', 'end')):
+                if event == 'start':
+                    depth += 1
+                    if depth == 2 and elem.tag == 'data':
+                        data_children += 1
+                    continue
+                depth -= 1
+                if depth == 0:
+                    # Letztes end-Event ist der Root
+                    root_tag = elem.tag
+                elem.clear()
             analysis['structure_info']['parseable'] = True
+            return None, (root_tag, data_children)
             
-        except ET.ParseError as e:
-            line_num = getattr(e, 'lineno', 'unknown')
-            analysis['issues'].append({
-                'type': 'CRITICAL',
-                'message': f'XML Parser-Fehler auf Zeile {line_num}: {e}',
-                'fix': 'Korrigiere XML-Syntax-Fehler',
-                'line_info': [line_num] if line_num != 'unknown' else []
-            })
+        except _XML_PARSE_ERRORS as e:
+            # lxml setzt lineno, ElementTree nur position=(zeile, spalte)
+            line_num = getattr(e, 'lineno', None) or getattr(e, 'position', ('unknown',))[0]
             analysis['structure_info']['parseable'] = False
             analysis['valid'] = False
+            return Issue(
+                type='CRITICAL',
+                message=f'XML Parser-Fehler auf Zeile {line_num}: {e}',
+                fix='Korrigiere XML-Syntax-Fehler',
+                line_info=[line_num] if line_num != 'unknown' else []
+            ), (root_tag, data_children)
     
-    def auto_fix_xml_file(self, xml_file: Path, analysis: Dict) -> bool:
+    def auto_fix_xml_file(self, xml_file: Path, analysis: Dict,
+                          original_content: Optional[bytes] = None) -> Tuple[bool, Optional[bytes]]:
         """
         Automatische Reparatur häufiger XML-Probleme
         
         Args:
             xml_file: Pfad zur XML-Datei
             analysis: Analyse-Ergebnisse
+            original_content: Bereits gelesener Inhalt (sonst wird die Datei gelesen)
             
         Returns:
-            bool: True wenn Reparatur erfolgreich
+            Tuple[bool, Optional[bytes]]: (Reparatur erfolgreich, neuer Inhalt
+            oder None wenn unverändert)
         """
         try:
-            with open(xml_file, 'r', encoding='utf-8') as f:
-                original_content = f.read()
+            if original_content is None:
+                original_content = self._read_xml(xml_file)
             
             content = original_content
             fixes_applied = []
             
+            # Nur Fixes ausführen, deren Problem die Analyse gemeldet hat
+            flags = {
+                issue.fix_key for issue in analysis.get('issues', [])
+                if issue.auto_fixable
+            }
+            
             # 1. FIX: BOM entfernen
-            if content.startswith('\ufeff'):
-                content = content[1:]
+            if 'bom' in flags and content.startswith(_UTF8_BOM):
+                content = content[len(_UTF8_BOM):]
                 fixes_applied.append('BOM entfernt')
             
             # 2. FIX: XML-Deklaration hinzufügen
-            if not re.search(r'<\?xml[^>]*\?>', content):
-                content = '<?xml version="1.0" encoding="utf-8"?>\n' + content
+            if 'xml_decl' in flags and not _RE_XML_DECL.search(content):
+                content = b'<?xml version="1.0" encoding="utf-8"?>\n' + content
                 fixes_applied.append('XML-Deklaration hinzugefügt')
             
             # 3. FIX: Mehrere <data> Tags konsolidieren (HAUPTFIX!)
-            content, data_fixes = self._fix_multiple_data_tags(content)
-            fixes_applied.extend(data_fixes)
+            if 'multi_data' in flags:
+                content, data_fixes = self._fix_multiple_data_tags(content)
+                fixes_applied.extend(data_fixes)
             
             # 4. FIX: <data> Tag außerhalb <odoo> reparieren
-            content, nesting_fixes = self._fix_data_outside_odoo(content)
-            fixes_applied.extend(nesting_fixes)
+            if 'data_outside' in flags:
+                content, nesting_fixes = self._fix_data_outside_odoo(content)
+                fixes_applied.extend(nesting_fixes)
             
             # 5. FIX: Fehlende <data> Tags hinzufügen
-            content, missing_fixes = self._fix_missing_data_tags(content)
-            fixes_applied.extend(missing_fixes)
+            if 'missing_data' in flags:
+                content, missing_fixes = self._fix_missing_data_tags(content)
+                fixes_applied.extend(missing_fixes)
             
             # 6. FIX: Whitespace bereinigen
-            content, ws_fixes = self._fix_whitespace_issues(content)
-            fixes_applied.extend(ws_fixes)
+            if 'whitespace' in flags:
+                content, ws_fixes = self._fix_whitespace_issues(content)
+                fixes_applied.extend(ws_fixes)
             
             # 7. FIX: Grundlegende XML-Struktur
-            content, struct_fixes = self._fix_basic_structure(content)
-            fixes_applied.extend(struct_fixes)
+            if 'no_root' in flags:
+                content, struct_fixes = self._fix_basic_structure(content)
+                fixes_applied.extend(struct_fixes)
             
-            # Schreibe reparierte Datei
-            if content != original_content:
+            # Schreibe reparierte Datei; jeder Fix meldet sich nur, wenn er
+            # den Inhalt verändert hat, ein Inhaltsvergleich ist unnötig
+            if fixes_applied:
                 if self.create_backup:
                     backup_file = xml_file.with_suffix('.xml.backup')
-                    shutil.copy2(xml_file, backup_file)
-                    self.logger.info(f"📦 Backup erstellt: {backup_file}")
+                    _fast_backup(xml_file, backup_file)
+                    self.logger.info("📦 Backup erstellt: %s", backup_file)
                 
-                with open(xml_file, 'w', encoding='utf-8') as f:
+                with open(xml_file, 'wb') as f:
                     f.write(content)
                 
-                self.logger.info(f"✅ Datei repariert: {xml_file}")
+                self.logger.info("✅ Datei repariert: %s", xml_file)
                 for fix in fixes_applied:
-                    self.logger.info(f"   🔧 {fix}")
+                    self.logger.info("   🔧 %s", fix)
                 
                 self.fixes_applied.extend(fixes_applied)
-                return True
+                return True, content
             else:
-                self.logger.info(f"ℹ️  Keine Reparaturen nötig: {xml_file}")
-                return True
+                self.logger.info("ℹ️  Keine Reparaturen nötig: %s", xml_file)
+                return True, None
                 
         except Exception as e:
-            self.logger.error(f"❌ Auto-Fix fehlgeschlagen für {xml_file}: {e}")
-            return False
+            self.logger.error("❌ Auto-Fix fehlgeschlagen für %s: %s", xml_file, e)
+            return False, None
     
-    def _fix_multiple_data_tags(self, content: str) -> Tuple[str, List[str]]:
+    def _fix_multiple_data_tags(self, content: bytes) -> Tuple[bytes, List[str]]:
         """
         Repariert mehrere <data> Tags - HAUPTFIX für den Odoo-Fehler!
         
@@ -471,11 +806,10 @@ class OdooXMLDebugger:
         fixes = []
         
         # Finde alle <data> Blöcke
-        data_pattern = r'<data[^>]*>(.*?)</data>'
-        data_matches = list(re.finditer(data_pattern, content, re.DOTALL))
+        data_matches = list(_RE_DATA_BLOCK.finditer(content))
         
         if len(data_matches) > 1:
-            self.logger.info(f"🔧 Repariere {len(data_matches)} mehrfache <data> Tags")
+            self.logger.info("🔧 Repariere %d mehrfache <data> Tags", len(data_matches))
             
             # Sammle alle Inhalte
             all_data_content = []
@@ -483,44 +817,46 @@ class OdooXMLDebugger:
             
             for match in data_matches:
                 # Extrahiere Attribute vom <data> Tag
-                data_tag = content[match.start():match.start() + content[match.start():].find('>') + 1]
-                attr_match = re.search(r'<data([^>]*)', data_tag)
-                if attr_match:
-                    attrs = attr_match.group(1).strip()
-                    if attrs and attrs not in data_attributes:
-                        data_attributes.append(attrs)
+                attrs = match.group(1).strip()
+                if attrs and attrs not in data_attributes:
+                    data_attributes.append(attrs)
                 
                 # Extrahiere Inhalt
-                inner_content = match.group(1).strip()
+                inner_content = match.group(2).strip()
                 if inner_content:
                     all_data_content.append(inner_content)
             
             # Erstelle konsolidierten <data> Block
-            combined_attrs = ' '.join(data_attributes) if data_attributes else ''
+            combined_attrs = b' '.join(data_attributes) if data_attributes else b''
             if combined_attrs:
-                combined_attrs = ' ' + combined_attrs
+                combined_attrs = b' ' + combined_attrs
                 
-            combined_content = '\n\n        '.join(all_data_content)
-            new_data_block = f'<data{combined_attrs}>\n\n        {combined_content}\n\n    </data>'
+            combined_content = b'\n\n        '.join(all_data_content)
+            new_data_block = b'<data%s>\n\n        %s\n\n    </data>' % (combined_attrs, combined_content)
             
-            # Entferne alle alten <data> Blöcke und füge neuen hinzu
-            # Entferne von hinten nach vorne, um Indizes nicht zu verschieben
-            for match in reversed(data_matches):
-                content = content[:match.start()] + content[match.end():]
+            # Entferne alle alten <data> Blöcke und füge neuen hinzu;
+            # die Teile dazwischen werden in einem Durchlauf zusammengefügt
+            parts = []
+            last_end = 0
+            for match in data_matches:
+                parts.append(content[last_end:match.start()])
+                last_end = match.end()
+            parts.append(content[last_end:])
+            content = b''.join(parts)
             
             # Füge neuen <data> Block vor </odoo> ein
-            odoo_close_pos = content.rfind('</odoo>')
+            odoo_close_pos = content.rfind(b'</odoo>')
             if odoo_close_pos != -1:
-                content = content[:odoo_close_pos] + f'\n    {new_data_block}\n\n' + content[odoo_close_pos:]
+                content = content[:odoo_close_pos] + b'\n    %s\n\n' % new_data_block + content[odoo_close_pos:]
             else:
                 # Fallback: Füge am Ende hinzu
-                content += f'\n    {new_data_block}\n'
+                content += b'\n    %s\n' % new_data_block
             
             fixes.append(f'Konsolidiert {len(data_matches)} <data> Tags zu einem')
         
         return content, fixes
     
-    def _fix_data_outside_odoo(self, content: str) -> Tuple[str, List[str]]:
+    def _fix_data_outside_odoo(self, content: bytes) -> Tuple[bytes, List[str]]:
         """Repariert <data> Tags die außerhalb von <odoo> stehen"""
         fixes = []
         
@@ -530,66 +866,65 @@ class OdooXMLDebugger:
         
         return content, fixes
     
-    def _fix_missing_data_tags(self, content: str) -> Tuple[str, List[str]]:
+    def _fix_missing_data_tags(self, content: bytes) -> Tuple[bytes, List[str]]:
         """Fügt fehlende <data> Tags hinzu"""
         fixes = []
         
         # Prüfe ob <data> Tags fehlen aber Inhalt vorhanden ist
-        if '<data' not in content:
-            content_patterns = [r'<record[^>]*>', r'<menuitem[^>]*>', r'<template[^>]*>']
-            has_content = any(re.search(pattern, content) for pattern in content_patterns)
+        if b'<data' not in content:
+            has_content = _RE_CONTENT.search(content) is not None
             
             if has_content:
                 # Wickle bestehenden Inhalt in <data> Tags
-                odoo_start = content.find('<odoo')
-                odoo_end = content.find('>', odoo_start) + 1
-                odoo_close = content.rfind('</odoo>')
+                odoo_start = content.find(b'<odoo')
+                odoo_end = content.find(b'>', odoo_start) + 1
+                odoo_close = content.rfind(b'</odoo>')
                 
                 if odoo_start != -1 and odoo_close != -1:
                     before_odoo = content[:odoo_end]
                     odoo_content = content[odoo_end:odoo_close].strip()
                     after_odoo = content[odoo_close:]
                     
-                    wrapped_content = f'\n    <data>\n\n        {odoo_content}\n\n    </data>\n'
+                    wrapped_content = b'\n    <data>\n\n        %s\n\n    </data>\n' % odoo_content
                     content = before_odoo + wrapped_content + after_odoo
                     
                     fixes.append('Fehlende <data> Tags hinzugefügt')
         
         return content, fixes
     
-    def _fix_whitespace_issues(self, content: str) -> Tuple[str, List[str]]:
+    def _fix_whitespace_issues(self, content: bytes) -> Tuple[bytes, List[str]]:
         """Repariert Whitespace-Probleme"""
         fixes = []
         
-        # Entferne trailing whitespaces
-        lines = content.split('\n')
-        cleaned_lines = [line.rstrip() for line in lines]
+        # Entferne trailing whitespaces in einem Durchlauf über den Inhalt;
+        # ohne Treffer liefert sub() unverändert denselben Inhalt
+        cleaned = _RE_TRAILING_WS.sub(b'', content)
         
-        if lines != cleaned_lines:
-            content = '\n'.join(cleaned_lines)
+        if cleaned != content:
+            content = cleaned
             fixes.append('Trailing Whitespaces entfernt')
         
         # Normalisiere Zeilenenden
-        if '\r\n' in content:
-            content = content.replace('\r\n', '\n')
+        if b'\r\n' in content:
+            content = content.replace(b'\r\n', b'\n')
             fixes.append('Windows-Zeilenenden zu Unix konvertiert')
         
         return content, fixes
     
-    def _fix_basic_structure(self, content: str) -> Tuple[str, List[str]]:
+    def _fix_basic_structure(self, content: bytes) -> Tuple[bytes, List[str]]:
         """Repariert grundlegende XML-Struktur"""
         fixes = []
         
         # Stelle sicher, dass <odoo> Root-Element vorhanden ist
-        if '<odoo' not in content:
+        if b'<odoo' not in content:
             # Wickle gesamten Inhalt in <odoo> Tags
-            xml_decl_match = re.search(r'<\?xml[^>]*\?>', content)
+            xml_decl_match = _RE_XML_DECL.search(content)
             if xml_decl_match:
                 xml_decl = xml_decl_match.group(0)
                 rest_content = content[xml_decl_match.end():].strip()
-                content = f'{xml_decl}\n<odoo>\n    <data>\n\n        {rest_content}\n\n    </data>\n</odoo>'
+                content = b'%s\n<odoo>\n    <data>\n\n        %s\n\n    </data>\n</odoo>' % (xml_decl, rest_content)
             else:
-                content = f'<odoo>\n    <data>\n\n        {content}\n\n    </data>\n</odoo>'
+                content = b'<odoo>\n    <data>\n\n        %s\n\n    </data>\n</odoo>' % content
             
             fixes.append('Fehlende <odoo> Root-Struktur hinzugefügt')
         
@@ -597,19 +932,22 @@ class OdooXMLDebugger:
     
     def scan_module(self, module_path: Path) -> Dict:
         """Scannt alle XML-Dateien in einem Modul"""
-        self.logger.info(f"🔍 Scanne Modul: {module_path}")
+        self.logger.info("🔍 Scanne Modul: %s", module_path)
         
-        xml_files = list(module_path.rglob("*.xml"))
-        self.logger.info(f"📄 Gefundene XML-Dateien: {len(xml_files)}")
+        # (Pfad, relativer Pfad, Dateiname) einmal bestimmen statt pro Logzeile
+        xml_files = self._find_xml_files(module_path)
+        self.logger.info("📄 Gefundene XML-Dateien: %d", len(xml_files))
         
         results = []
         total_issues = 0
         critical_files = 0
         
-        for xml_file in xml_files:
-            self.logger.info(f"🔧 Analysiere: {xml_file.relative_to(module_path)}")
-            
-            analysis = self.analyze_xml_structure(xml_file)
+        # Analyse parallel über alle geänderten Dateien; Auto-Fix und
+        # Zusammenfassung bleiben seriell, da sie Dateien bzw. Zähler verändern
+        analyses, cache_entries = self._analyze_with_cache(module_path, xml_files)
+        
+        for (xml_file, rel_path, file_name), analysis in zip(xml_files, analyses):
+            self.logger.debug("🔧 Analysiere: %s", rel_path)
             results.append(analysis)
             
             issue_count = len(analysis.get('issues', []))
@@ -617,19 +955,24 @@ class OdooXMLDebugger:
             
             if not analysis.get('valid', True):
                 critical_files += 1
-                self.logger.warning(f"❌ KRITISCH: {xml_file.name} - {issue_count} Issues")
+                self.logger.warning("❌ KRITISCH: %s - %d Issues", file_name, issue_count)
                 
                 # Auto-Fix wenn aktiviert
-                if self.auto_fix and any(issue.get('auto_fixable', False) for issue in analysis['issues']):
-                    self.logger.info(f"🔧 Starte Auto-Fix für {xml_file.name}")
-                    fix_success = self.auto_fix_xml_file(xml_file, analysis)
+                if self.auto_fix and any(issue.auto_fixable for issue in analysis['issues']):
+                    self.logger.info("🔧 Starte Auto-Fix für %s", file_name)
+                    fix_success, new_content = self.auto_fix_xml_file(xml_file, analysis)
                     
-                    if fix_success:
-                        # Re-analysiere nach Fix
-                        analysis = self.analyze_xml_structure(xml_file)
+                    # Re-analysiere nur, wenn sich der Inhalt geändert hat,
+                    # direkt auf dem reparierten Inhalt statt erneut von Platte
+                    if fix_success and new_content is not None:
+                        analysis = self.analyze_xml_content(new_content, xml_file)
                         results[-1] = analysis  # Update Result
+                        cache_entries.pop(rel_path, None)  # Datei hat sich geändert
             else:
-                self.logger.info(f"✅ OK: {xml_file.name}")
+                self.logger.debug("✅ OK: %s", file_name)
+        
+        if self.use_cache and self.save_cache:
+            self._save_cache(module_path, cache_entries)
         
         # Zusammenfassung
         summary = {
@@ -644,6 +987,105 @@ class OdooXMLDebugger:
         self._print_summary(summary)
         return summary
     
+    def _analyze_with_cache(self, module_path: Path,
+                            xml_files: List[Tuple[Path, str, str]]) -> Tuple[List[Dict], Dict]:
+        """
+        Analysiert nur Dateien, deren mtime/Größe vom Cache abweicht
+        
+        Returns:
+            Tuple[List[Dict], Dict]: Analysen in Eingabereihenfolge und die
+            neuen Cache-Einträge
+        """
+        cache = self._load_cache(module_path) if self.use_cache else {}
+        analyses = [None] * len(xml_files)
+        cache_entries = {}
+        stat_keys = {}
+        pending = []
+        
+        for index, (xml_file, rel_path, _name) in enumerate(xml_files):
+            try:
+                stat = xml_file.stat()
+            except OSError:
+                pending.append(index)
+                continue
+            
+            stat_key = [stat.st_mtime_ns, stat.st_size]
+            entry = cache.get(rel_path)
+            if entry and entry[:2] == stat_key:
+                analyses[index] = dict(_analysis_from_json(entry[2]), file=str(xml_file))
+                cache_entries[rel_path] = entry
+            else:
+                stat_keys[index] = stat_key
+                pending.append(index)
+        
+        if self.use_cache:
+            self.logger.info("💾 Cache: %d von %d Dateien unverändert",
+                             len(xml_files) - len(pending), len(xml_files))
+        
+        fresh = self._analyze_files([xml_files[index][0] for index in pending])
+        for index, analysis in zip(pending, fresh):
+            analyses[index] = analysis
+            if index in stat_keys:
+                cache_entries[xml_files[index][1]] = stat_keys[index] + [_analysis_as_json(analysis)]
+        
+        return analyses, cache_entries
+    
+    def _load_cache(self, module_path: Path) -> Dict:
+        """Lädt den Analyse-Cache des Moduls (leer bei Fehlern oder alter Version)"""
+        try:
+            with open(_cache_path(module_path), 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        if not isinstance(cache, dict) or cache.get('version') != _CACHE_VERSION:
+            return {}
+        return cache.get('files', {})
+    
+    def _save_cache(self, module_path: Path, cache_entries: Dict):
+        """Schreibt den Analyse-Cache des Moduls"""
+        cache_file = _cache_path(module_path)
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump({'version': _CACHE_VERSION, 'files': cache_entries}, f, ensure_ascii=False)
+        except OSError as e:
+            self.logger.warning("⚠️  Analyse-Cache konnte nicht geschrieben werden: %s", e)
+    
+    def _find_xml_files(self, module_path: Path) -> List[Tuple[Path, str, str]]:
+        """
+        Sammelt alle XML-Dateien unterhalb von module_path per os.walk
+        
+        Returns:
+            List[Tuple[Path, str, str]]: (Pfad, relativer Pfad, Dateiname)
+        """
+        xml_files = []
+        for dirpath, dirnames, filenames in os.walk(module_path):
+            rel_dir = os.path.relpath(dirpath, module_path)
+            for name in filenames:
+                if name.endswith('.xml'):
+                    rel_path = name if rel_dir == os.curdir else os.path.join(rel_dir, name)
+                    xml_files.append((Path(dirpath, name), rel_path, name))
+        return xml_files
+    
+    def _analyze_files(self, xml_files: List[Path]) -> List[Dict]:
+        """
+        Analysiert mehrere Dateien parallel, Ergebnisse in Eingabereihenfolge
+        
+        Mit lxml genügen Threads, da lxml beim Parsen den GIL freigibt;
+        mit ElementTree wird auf Prozesse verteilt.
+        """
+        workers = min(os.cpu_count() or 1, len(xml_files))
+        if workers <= 1:
+            return [self.analyze_xml_structure(xml_file) for xml_file in xml_files]
+        
+        if _ET is not ET:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(self.analyze_xml_structure, xml_files))
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_analyze_worker, [str(p) for p in xml_files], chunksize=8))
+    
     def _print_summary(self, summary: Dict):
         """Druckt farbige Zusammenfassung"""
         print("\n" + "="*70)
@@ -668,7 +1110,7 @@ class OdooXMLDebugger:
                     issues = file_result.get('issues', [])
                     print(f"   💥 {file_name}:")
                     for issue in issues[:3]:  # Zeige nur die ersten 3 Issues
-                        print(f"      - {issue['type']}: {issue['message']}")
+                        print(f"      - {issue.type}: {issue.message}")
                     if len(issues) > 3:
                         print(f"      - ... und {len(issues) - 3} weitere Issues")
         
@@ -680,6 +1122,18 @@ class OdooXMLDebugger:
         print("="*70)
 
 
+# Debugger-Instanz je Worker-Prozess, wird beim ersten Aufruf angelegt
+_WORKER_DEBUGGER = None
+
+
+def _analyze_worker(path_str: str) -> Dict:
+    """Analysiert eine XML-Datei in einem Worker-Prozess"""
+    global _WORKER_DEBUGGER
+    if _WORKER_DEBUGGER is None:
+        _WORKER_DEBUGGER = OdooXMLDebugger()
+    return _WORKER_DEBUGGER.analyze_xml_structure(Path(path_str))
+
+
 def main():
     """Hauptfunktion für CLI-Verwendung"""
     parser = argparse.ArgumentParser(
@@ -698,6 +1152,9 @@ def main():
   
   # Nur Validierung ohne Backup
   python xml_debugger.py /path/to/module --validate-only --no-backup
+  
+  # Alle Dateien neu analysieren (Analyse-Cache ignorieren)
+  python xml_debugger.py /path/to/module --no-cache
         """
     )
     
@@ -710,6 +1167,8 @@ def main():
                        help='Nur Validierung, keine Änderungen')
     parser.add_argument('--no-backup', action='store_true',
                        help='Keine Backup-Dateien erstellen')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Analyse-Cache (unter ~/.cache/xml_debugger) nicht verwenden')
     
     args = parser.parse_args()
     
@@ -717,7 +1176,9 @@ def main():
     auto_fix = args.auto_fix and not args.validate_only
     create_backup = not args.no_backup
     
-    debugger = OdooXMLDebugger(auto_fix=auto_fix, create_backup=create_backup)
+    debugger = OdooXMLDebugger(auto_fix=auto_fix, create_backup=create_backup,
+                               use_cache=not args.no_cache,
+                               save_cache=not args.validate_only)
     
     if path.is_file():
         # Einzelne Datei analysieren
@@ -726,7 +1187,7 @@ def main():
         if not analysis['valid']:
             print(f"❌ Probleme gefunden in {path.name}:")
             for issue in analysis['issues']:
-                print(f"   {issue['type']}: {issue['message']}")
+                print(f"   {issue.type}: {issue.message}")
             
             if auto_fix:
                 debugger.auto_fix_xml_file(path, analysis)
@@ -743,7 +1204,8 @@ def main():
         # Exportiere Report
         report_file = path / f"xml_debug_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         with open(report_file, 'w') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
+            report = dict(summary, files=[_analysis_as_json(result) for result in summary['files']])
+            json.dump(report, f, indent=2, ensure_ascii=False)
         
         print(f"\n📊 Detaillierter Report: {report_file}")
         